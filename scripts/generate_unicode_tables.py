@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Generate src/unicode_tables.rs from Unicode 17.0.0 UCD data files."""
 
+import re
 import sys
 import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
 UCD_BASE = "https://www.unicode.org/Public/17.0.0/ucd/"
 
@@ -21,117 +24,132 @@ UCD_FILES = {
 
 CACHE_DIR = Path(__file__).parent / ".unicode_cache"
 
+# One UCD data line: `XXXX[..YYYY] ; field [; more fields] [# comment]`.
+# Group 3 is the first field after the code point range, without padding.
+UCD_RANGE_RE = re.compile(
+    rb"(?m)^([0-9A-Fa-f]+)(?:\.\.([0-9A-Fa-f]+))?[ \t]*;"
+    rb"[ \t]*([^;#\r\n]*?)[ \t]*(?:[;#]|\r?$)"
+)
+# The data part (everything before the comment) of a non-blank, non-comment line.
+UCD_DATA_LINE_RE = re.compile(rb"(?m)^[ \t]*([^#\r\n]*[^#\s])")
 
-def download_file(name: str, url_path: str) -> str:
-    CACHE_DIR.mkdir(exist_ok=True)
+
+def download_file(name: str, url_path: str) -> bytes:
     cached = CACHE_DIR / name
     if cached.exists():
-        return cached.read_text(encoding="utf-8")
+        return cached.read_bytes()
     url = UCD_BASE + url_path
     print(f"Downloading {url} ...", file=sys.stderr)
     with urllib.request.urlopen(url) as resp:
-        data = resp.read().decode("utf-8")
-    cached.write_text(data, encoding="utf-8")
+        data = resp.read()
+    cached.write_bytes(data)
     return data
 
 
-def parse_ranges(text: str) -> dict[str, list[tuple[int, int]]]:
+def parse_ranges(text: bytes) -> dict[str, list[tuple[int, int]]]:
     """Parse UCD file into {property_value: [(start, end), ...]}."""
-    result = defaultdict(list)
-    for line in text.splitlines():
-        line = line.split("#")[0].strip()
-        if not line:
+    result: dict[bytes, list[tuple[int, int]]] = {}
+    unsorted = set()
+    # UCD files list each value's ranges in ascending order, so merge while
+    # parsing and only fall back to sort + merge_ranges for values that don't.
+    for m in UCD_RANGE_RE.finditer(text):
+        lo = int(m.group(1), 16)
+        hi = int(m.group(2), 16) if m.group(2) else lo
+        key = m.group(3)
+        ranges = result.get(key)
+        if ranges is None:
+            result[key] = [(lo, hi)]
             continue
-        parts = line.split(";")
-        if len(parts) < 2:
-            continue
-        range_str = parts[0].strip()
-        prop_val = parts[1].strip()
-        if ".." in range_str:
-            lo, hi = range_str.split("..")
-            lo, hi = int(lo, 16), int(hi, 16)
+        last_lo, last_hi = ranges[-1]
+        if lo == last_hi + 1:
+            ranges[-1] = (last_lo, hi)
         else:
-            lo = hi = int(range_str, 16)
-        result[prop_val].append((lo, hi))
-    # Sort and merge ranges
-    for key in result:
+            ranges.append((lo, hi))
+            if lo <= last_hi:
+                unsorted.add(key)
+    for key in unsorted:
         result[key] = merge_ranges(sorted(result[key]))
-    return result
+    return {key.decode(): ranges for key, ranges in result.items()}
 
 
 def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     if not ranges:
         return ranges
-    merged = [ranges[0]]
-    for lo, hi in ranges[1:]:
-        prev_lo, prev_hi = merged[-1]
-        if lo <= prev_hi + 1:
-            merged[-1] = (prev_lo, max(prev_hi, hi))
+    merged = []
+    append = merged.append
+    it = iter(ranges)
+    # Keep the range being extended in locals; only emit it once it is closed.
+    cur_lo, cur_hi = next(it)
+    for lo, hi in it:
+        if lo <= cur_hi + 1:
+            if hi > cur_hi:
+                cur_hi = hi
         else:
-            merged.append((lo, hi))
+            append((cur_lo, cur_hi))
+            cur_lo, cur_hi = lo, hi
+    append((cur_lo, cur_hi))
     return merged
 
 
+def subtract_ranges(
+    ranges: list[tuple[int, int]], remove: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Return the parts of sorted `ranges` not covered by sorted, merged `remove`."""
+    result = []
+    j = 0
+    n = len(remove)
+    for lo, hi in ranges:
+        # Skip removed ranges that end before this one starts.
+        while j < n and remove[j][1] < lo:
+            j += 1
+        k = j
+        while lo <= hi:
+            if k >= n or remove[k][0] > hi:
+                result.append((lo, hi))
+                break
+            r_lo, r_hi = remove[k]
+            if r_lo > lo:
+                result.append((lo, r_lo - 1))
+            lo = r_hi + 1
+            k += 1
+    return result
+
+
 def parse_script_extensions(
-    text: str, script_data: dict[str, list[tuple[int, int]]]
+    text: bytes, script_data: dict[str, list[tuple[int, int]]]
 ) -> dict[str, list[tuple[int, int]]]:
     """Parse ScriptExtensions.txt. Each codepoint gets added to all listed scripts.
     Also inherits from Script property for codepoints not in ScriptExtensions."""
     scx = defaultdict(list)
     # Track which codepoints are covered by ScriptExtensions.txt
-    scx_covered = set()
+    scx_covered = []
 
-    for line in text.splitlines():
-        line = line.split("#")[0].strip()
-        if not line:
-            continue
-        parts = line.split(";")
-        if len(parts) < 2:
-            continue
-        range_str = parts[0].strip()
-        scripts_str = parts[1].strip()
-        if ".." in range_str:
-            lo, hi = range_str.split("..")
-            lo, hi = int(lo, 16), int(hi, 16)
-        else:
-            lo = hi = int(range_str, 16)
-        scripts = scripts_str.split()
-        for sc in scripts:
+    for m in UCD_RANGE_RE.finditer(text):
+        lo = int(m.group(1), 16)
+        hi = int(m.group(2), 16) if m.group(2) else lo
+        for sc in m.group(3).decode().split():
             scx[sc].append((lo, hi))
-        for cp in range(lo, hi + 1):
-            scx_covered.add(cp)
+        scx_covered.append((lo, hi))
+    scx_covered = merge_ranges(sorted(scx_covered))
 
-    # For codepoints NOT in ScriptExtensions, inherit from Script property
+    # For codepoints NOT in ScriptExtensions, inherit from Script property.
+    # This includes Common, Inherited, and Unknown, whose Script value becomes
+    # their Script_Extensions value.
     for script_name, ranges in script_data.items():
-        if script_name in ("Common", "Inherited", "Unknown"):
-            continue
-        for lo, hi in ranges:
-            for cp in range(lo, hi + 1):
-                if cp not in scx_covered:
-                    scx[script_name].append((cp, cp))
-
-    # Also, Common, Inherited, and Unknown codepoints that are NOT in ScriptExtensions
-    # get their Script value as their Script_Extensions value
-    for script_name in ("Common", "Inherited", "Unknown"):
-        if script_name in script_data:
-            for lo, hi in script_data[script_name]:
-                for cp in range(lo, hi + 1):
-                    if cp not in scx_covered:
-                        scx[script_name].append((cp, cp))
+        uncovered = subtract_ranges(ranges, scx_covered)
+        if uncovered:
+            scx[script_name].extend(uncovered)
 
     for key in scx:
         scx[key] = merge_ranges(sorted(scx[key]))
     return dict(scx)
 
 
-def parse_property_value_aliases(text: str) -> dict[str, dict[str, list[str]]]:
+def parse_property_value_aliases(text: bytes) -> dict[str, dict[str, list[str]]]:
     """Parse PropertyValueAliases.txt -> {property: {canonical: [aliases]}}."""
     result = defaultdict(lambda: defaultdict(list))
-    for line in text.splitlines():
-        line = line.split("#")[0].strip()
-        if not line:
-            continue
-        parts = [p.strip() for p in line.split(";")]
+    for m in UCD_DATA_LINE_RE.finditer(text):
+        parts = [p.strip() for p in m.group(1).decode().split(";")]
         if len(parts) < 3:
             continue
         prop = parts[0]
@@ -189,10 +207,17 @@ def remove_surrogates(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
 
 
 def format_ranges(ranges: list[tuple[int, int]]) -> str:
-    parts = []
-    for lo, hi in ranges:
-        parts.append(f"(0x{lo:04X}, 0x{hi:04X})")
-    return ", ".join(parts)
+    return ", ".join([f"(0x{lo:04X}, 0x{hi:04X})" for lo, hi in ranges])
+
+
+def synonym_groups(aliases: dict[str, list[str]]) -> dict[str, set[str]]:
+    """Map every name in {canonical: [aliases]} to all names it is synonymous with."""
+    synonyms: dict[str, set[str]] = {}
+    for canonical, alias_list in aliases.items():
+        group = {canonical, *alias_list}
+        for n in group:
+            synonyms.setdefault(n, set()).update(group)
+    return synonyms
 
 
 def to_rust_ident(name: str) -> str:
@@ -208,13 +233,19 @@ def generate_rust(
     aliases: dict,
     script_aliases: dict,
     gc_aliases: dict,
-) -> str:
-    lines = []
-    lines.append("// AUTO-GENERATED by scripts/generate_unicode_tables.py")
-    lines.append("// Unicode 17.0.0 — do not edit manually.")
-    lines.append("")
-    lines.append("#![allow(clippy::unreadable_literal)]")
-    lines.append("")
+    out: BinaryIO,
+) -> None:
+    """Write the generated Rust source to `out` as UTF-8, line by line."""
+    write = out.write
+
+    def emit(line: str = "") -> None:
+        write(f"{line}\n".encode())
+
+    emit("// AUTO-GENERATED by scripts/generate_unicode_tables.py")
+    emit("// Unicode 17.0.0 — do not edit manually.")
+    emit()
+    emit("#![allow(clippy::unreadable_literal)]")
+    emit()
 
     all_tables = {}  # Maps (category, canonical_name) -> rust_const_name
 
@@ -222,23 +253,23 @@ def generate_rust(
     for name, ranges in sorted(script_data.items()):
         const_name = f"SCRIPT_{to_rust_ident(name).upper()}"
         ranges_no_surr = remove_surrogates(ranges)
-        lines.append(
+        emit(
             f"const {const_name}: &[(u32, u32)] = &[{format_ranges(ranges_no_surr)}];"
         )
         all_tables[("Script", name)] = const_name
 
-    lines.append("")
+    emit()
 
     # Script_Extensions tables
     for name, ranges in sorted(scx_data.items()):
         const_name = f"SCX_{to_rust_ident(name).upper()}"
         ranges_no_surr = remove_surrogates(ranges)
-        lines.append(
+        emit(
             f"const {const_name}: &[(u32, u32)] = &[{format_ranges(ranges_no_surr)}];"
         )
         all_tables[("Script_Extensions", name)] = const_name
 
-    lines.append("")
+    emit()
 
     # General_Category tables
     # Also compute composite categories
@@ -255,7 +286,7 @@ def generate_rust(
     for name, ranges in sorted(gc_data.items()):
         const_name = f"GC_{to_rust_ident(name).upper()}"
         ranges_no_surr = remove_surrogates(ranges)
-        lines.append(
+        emit(
             f"const {const_name}: &[(u32, u32)] = &[{format_ranges(ranges_no_surr)}];"
         )
         all_tables[("General_Category", name)] = const_name
@@ -270,18 +301,18 @@ def generate_rust(
             combined = merge_ranges(sorted(combined))
             const_name = f"GC_{to_rust_ident(comp_name).upper()}"
             ranges_no_surr = remove_surrogates(combined)
-            lines.append(
+            emit(
                 f"const {const_name}: &[(u32, u32)] = &[{format_ranges(ranges_no_surr)}];"
             )
             all_tables[("General_Category", comp_name)] = const_name
 
-    lines.append("")
+    emit()
 
     # Binary property tables
     for name, ranges in sorted(binary_data.items()):
         const_name = f"BINARY_{to_rust_ident(name).upper()}"
         ranges_no_surr = remove_surrogates(ranges)
-        lines.append(
+        emit(
             f"const {const_name}: &[(u32, u32)] = &[{format_ranges(ranges_no_surr)}];"
         )
         all_tables[("Binary", name)] = const_name
@@ -289,11 +320,11 @@ def generate_rust(
     # Special binary properties
     # ASCII
     if ("Binary", "ASCII") not in all_tables:
-        lines.append("const BINARY_ASCII: &[(u32, u32)] = &[(0x0000, 0x007F)];")
+        emit("const BINARY_ASCII: &[(u32, u32)] = &[(0x0000, 0x007F)];")
         all_tables[("Binary", "ASCII")] = "BINARY_ASCII"
 
     # Any
-    lines.append(
+    emit(
         "const BINARY_ANY: &[(u32, u32)] = &[(0x0000, 0xD7FF), (0xE000, 0x10FFFF)];"
     )
     all_tables[("Binary", "Any")] = "BINARY_ANY"
@@ -301,119 +332,110 @@ def generate_rust(
     # Assigned = complement of Unassigned (gc=Cn)
     if "Cn" in gc_data:
         assigned_ranges = compute_complement(gc_data["Cn"])
-        lines.append(
+        emit(
             f"const BINARY_ASSIGNED: &[(u32, u32)] = &[{format_ranges(assigned_ranges)}];"
         )
         all_tables[("Binary", "Assigned")] = "BINARY_ASSIGNED"
 
-    lines.append("")
+    emit()
 
     # Build the lookup function
-    lines.append(
-        "pub fn lookup_property(content: &str) -> Option<&'static [(u32, u32)]> {"
+    emit(
+        "pub(crate) fn lookup_property(content: &str) -> Option<&'static [(u32, u32)]> {"
     )
-    lines.append("    if let Some(eq_pos) = content.find('=') {")
-    lines.append("        let prop_name = &content[..eq_pos];")
-    lines.append("        let prop_value = &content[eq_pos + 1..];")
-    lines.append("        match prop_name {")
-    lines.append('            "Script" | "sc" => lookup_script(prop_value),')
-    lines.append(
+    emit("    if let Some(eq_pos) = content.find('=') {")
+    emit("        let prop_name = &content[..eq_pos];")
+    emit("        let prop_value = &content[eq_pos + 1..];")
+    emit("        match prop_name {")
+    emit('            "Script" | "sc" => lookup_script(prop_value),')
+    emit(
         '            "Script_Extensions" | "scx" => lookup_script_extensions(prop_value),'
     )
-    lines.append('            "General_Category" | "gc" => lookup_gc(prop_value),')
-    lines.append("            _ => None,")
-    lines.append("        }")
-    lines.append("    } else {")
-    lines.append("        // Try binary property first, then lone GC value")
-    lines.append("        if let Some(r) = lookup_binary(content) {")
-    lines.append("            return Some(r);")
-    lines.append("        }")
-    lines.append("        lookup_gc(content)")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
+    emit('            "General_Category" | "gc" => lookup_gc(prop_value),')
+    emit("            _ => None,")
+    emit("        }")
+    emit("    } else {")
+    emit("        // Try binary property first, then lone GC value")
+    emit("        if let Some(r) = lookup_binary(content) {")
+    emit("            return Some(r);")
+    emit("        }")
+    emit("        lookup_gc(content)")
+    emit("    }")
+    emit("}")
+    emit()
+    emit("/// Look up `name` in a table sorted by name (byte order).")
+    emit("fn lookup_sorted(")
+    emit("    table: &'static [(&'static str, &'static [(u32, u32)])],")
+    emit("    name: &str,")
+    emit(") -> Option<&'static [(u32, u32)]> {")
+    emit("    table")
+    emit("        .binary_search_by(|&(k, _)| k.cmp(name))")
+    emit("        .ok()")
+    emit("        .map(|i| table[i].1)")
+    emit("}")
+    emit()
+
+    def emit_lookup(
+        fn_name: str, arg: str, table_name: str, entries: list[tuple[str, str]]
+    ) -> None:
+        """Emit fn_name as a binary search over a sorted (name, table) array.
+
+        A string `match` with hundreds of arms compiles to a chain of
+        comparisons. Earlier entries win on duplicate names, as match arms would.
+        """
+        by_name: dict[str, str] = {}
+        for n, const_name in entries:
+            by_name.setdefault(n, const_name)
+        emit(f"static {table_name}: &[(&str, &[(u32, u32)])] = &[")
+        for n in sorted(by_name):
+            emit(f'    ("{n}", {by_name[n]}),')
+        emit("];")
+        emit()
+        emit(f"fn {fn_name}({arg}: &str) -> Option<&'static [(u32, u32)]> {{")
+        emit(f"    lookup_sorted({table_name}, {arg})")
+        emit("}")
+        emit()
+
+    # Resolve every name's synonyms once rather than scanning the alias
+    # lists again for each emitted table.
+    script_synonyms = synonym_groups(script_aliases)
+    gc_synonyms = synonym_groups(gc_aliases)
 
     # lookup_script
-    lines.append("fn lookup_script(value: &str) -> Option<&'static [(u32, u32)]> {")
-    lines.append("    match value {")
+    entries = []
     for name in sorted(script_data.keys()):
         const_name = all_tables[("Script", name)]
-        # Add aliases
-        names = {name}
-        for canonical, alias_list in script_aliases.items():
-            if canonical == name:
-                names.update(alias_list)
-            elif name in alias_list:
-                names.add(canonical)
-                names.update(alias_list)
+        names = {name, *script_synonyms.get(name, ())}
         for n in sorted(names):
-            lines.append(f'        "{n}" => Some({const_name}),')
-    lines.append("        _ => None,")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
+            entries.append((n, const_name))
+    emit_lookup("lookup_script", "value", "SCRIPT_BY_NAME", entries)
 
     # lookup_script_extensions
-    lines.append(
-        "fn lookup_script_extensions(value: &str) -> Option<&'static [(u32, u32)]> {"
-    )
-    lines.append("    match value {")
+    entries = []
     for name in sorted(scx_data.keys()):
         const_name = all_tables[("Script_Extensions", name)]
         # Use same aliases as Script
-        names = {name}
-        for canonical, alias_list in script_aliases.items():
-            if canonical == name:
-                names.update(alias_list)
-            elif name in alias_list:
-                names.add(canonical)
-                names.update(alias_list)
+        names = {name, *script_synonyms.get(name, ())}
         for n in sorted(names):
-            lines.append(f'        "{n}" => Some({const_name}),')
-    lines.append("        _ => None,")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
+            entries.append((n, const_name))
+    emit_lookup("lookup_script_extensions", "value", "SCX_BY_NAME", entries)
 
     # lookup_gc
-    lines.append("fn lookup_gc(value: &str) -> Option<&'static [(u32, u32)]> {")
-    lines.append("    match value {")
-    # Build GC alias map
-    gc_alias_map = {}
-    for canonical, alias_list in gc_aliases.items():
-        for a in alias_list:
-            gc_alias_map[a] = canonical
-        gc_alias_map[canonical] = canonical
-
-    emitted_gc = set()
+    entries = []
     for cat, name in sorted(all_tables.keys()):
         if cat != "General_Category":
             continue
         const_name = all_tables[("General_Category", name)]
-        names = {name}
         # Add long name aliases
-        for canonical, alias_list in gc_aliases.items():
-            if canonical == name or name in alias_list:
-                names.add(canonical)
-                names.update(alias_list)
+        names = {name, *gc_synonyms.get(name, ())}
         for n in sorted(names):
-            if n not in emitted_gc:
-                lines.append(f'        "{n}" => Some({const_name}),')
-                emitted_gc.add(n)
+            entries.append((n, const_name))
     # Also add "punct" alias for Punctuation
-    if "punct" not in emitted_gc and ("General_Category", "P") in all_tables:
-        lines.append(
-            f'        "punct" => Some({all_tables[("General_Category", "P")]}),'
-        )
-    lines.append("        _ => None,")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
+    if ("General_Category", "P") in all_tables:
+        entries.append(("punct", all_tables[("General_Category", "P")]))
+    emit_lookup("lookup_gc", "value", "GC_BY_NAME", entries)
 
     # lookup_binary
-    lines.append("fn lookup_binary(name: &str) -> Option<&'static [(u32, u32)]> {")
-    lines.append("    match name {")
-
     # Add common aliases for the self-named binary properties.
     binary_aliases = {
         "ASCII_Hex_Digit": ["AHex"],
@@ -472,7 +494,7 @@ def generate_rust(
         "Assigned": [],
     }
 
-    emitted_binary = set()
+    entries = []
     for name in sorted(all_tables.keys()):
         cat, prop_name = name
         if cat != "Binary":
@@ -482,23 +504,18 @@ def generate_rust(
         if prop_name in binary_aliases:
             names.update(binary_aliases[prop_name])
         for n in sorted(names):
-            if n not in emitted_binary:
-                lines.append(f'        "{n}" => Some({const_name}),')
-                emitted_binary.add(n)
-
-    lines.append("        _ => None,")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
-
-    return "\n".join(lines)
+            entries.append((n, const_name))
+    emit_lookup("lookup_binary", "name", "BINARY_BY_NAME", entries)
 
 
 def main():
-    # Download UCD files
-    texts = {}
-    for name, url_path in UCD_FILES.items():
-        texts[name] = download_file(name, url_path)
+    # Download UCD files. Cache misses are network-bound, so fetch them
+    # concurrently; the cache directory is created up front to avoid racing on it.
+    CACHE_DIR.mkdir(exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(UCD_FILES)) as pool:
+        texts = dict(
+            zip(UCD_FILES, pool.map(download_file, UCD_FILES, UCD_FILES.values()))
+        )
 
     # Parse Script property
     script_data = parse_ranges(texts["Scripts.txt"])
@@ -571,20 +588,27 @@ def main():
     script_aliases = pva.get("sc", {})
     gc_aliases = pva.get("gc", {})
 
-    # Generate Rust source
-    rust_src = generate_rust(
-        script_data,
-        scx_data,
-        gc_data,
-        binary_data,
-        pva,
-        script_aliases,
-        gc_aliases,
-    )
-
+    # Generate Rust source straight into a sibling temp file, then swap it in
+    # so a failure part-way through never leaves a truncated table file.
     out_path = Path(__file__).parent.parent / "src" / "unicode_tables.rs"
-    out_path.write_text(rust_src, encoding="utf-8")
-    size_kb = out_path.stat().st_size / 1024
+    tmp_path = out_path.with_suffix(".rs.tmp")
+    try:
+        with tmp_path.open("wb", buffering=1 << 20) as out:
+            generate_rust(
+                script_data,
+                scx_data,
+                gc_data,
+                binary_data,
+                pva,
+                script_aliases,
+                gc_aliases,
+                out,
+            )
+            size_kb = out.tell() / 1024
+        tmp_path.replace(out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     print(f"Generated {out_path} ({size_kb:.0f} KB)", file=sys.stderr)
 
 
@@ -6,8 +6,11 @@ Tests can use throw to signal failure.
 """
 
 import argparse
+import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 
@@ -21,6 +24,22 @@ def find_tests(test_dir: Path) -> list[Path]:
     return _collect_tests(test_dir)
 
 
+def run_one(test: Path, jsse: str, timeout: int) -> tuple[Path, str | None]:
+    """Run one test; return its path and None on pass, else the failure text."""
+    try:
+        result = subprocess.run(
+            [jsse, str(test)],
+            timeout=timeout,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except subprocess.TimeoutExpired:
+        return test, "TIMEOUT"
+    if result.returncode == 0:
+        return test, None
+    return test, result.stderr.decode("utf-8", errors="replace").strip()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run custom JSSE tests")
     parser.add_argument(
@@ -34,6 +53,13 @@ def main():
         default=10,
         help="Timeout per test in seconds",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel jobs (default: nproc)",
+    )
     parser.add_argument(
         "paths",
         nargs="*",
@@ -65,22 +91,14 @@ def main():
     failed = 0
     errors = []
 
-    for test in tests:
-        try:
-            result = subprocess.run(
-                [str(jsse), str(test)],
-                timeout=args.timeout,
-                capture_output=True,
-            )
-            if result.returncode == 0:
+    run = partial(run_one, jsse=str(jsse), timeout=args.timeout)
+    with ProcessPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        for test, err in pool.map(run, tests, chunksize=4):
+            if err is None:
                 passed += 1
             else:
                 failed += 1
-                stderr = result.stderr.decode("utf-8", errors="replace").strip()
-                errors.append((str(test), stderr))
-        except subprocess.TimeoutExpired:
-            failed += 1
-            errors.append((str(test), "TIMEOUT"))
+                errors.append((str(test), err))
 
     total = passed + failed
     print("\n=== Custom Test Results ===")
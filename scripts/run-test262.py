@@ -14,23 +14,51 @@ Examples:
 
 import argparse
 import ctypes
+import functools
 import json
 import math
+import multiprocessing
 import os
 import random
 import re
-import resource
+import shutil
 import signal
 import subprocess
 import sys
 import tempfile
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 _main_pgid = None
 
+# Per-run settings, identical for every scenario. Set once per pool worker by
+# _worker_init so they are not pickled into each task.
+_TIMEOUT = 120
+_HARNESS_DIR = os.path.join("test262", "harness", "")
+_ADAPTER: "EngineAdapter | None" = None
+_CHILD_ENV: dict[str, str] = {}
+_LAUNCHER: list[str] = []
+# (scenario_id, mode, metadata) for every scenario of the run; tasks are
+# indices into it, so only an int per scenario crosses the pool's queues.
+_SCENARIOS: list[tuple[str, str, dict | None]] = []
+
+# How much of an engine's stderr is decoded for the parse-error check. This
+# only bounds decoding: the pipes are still drained in full, since an engine
+# left blocked on a full pipe would hang until the timeout.
+_STDERR_DECODE_LIMIT = 64 * 1024
+
+# Scenario outcomes as returned by run_single_test; the driver uses them to
+# index its per-outcome result lists. ERROR is a runner problem (the engine
+# could not be started), not a verdict on the test.
+PASS, FAIL, SKIP, ERROR = 0, 1, 2, 3
+
+# Harness file contents keyed by name, filled lazily in each worker: the same
+# few files are prepended to nearly every test.
+_HARNESS_CACHE: dict[str, bytes] = {}
+
 
 def _set_pdeathsig():
     """Set PR_SET_PDEATHSIG so this process dies when its parent dies (Linux only)."""
@@ -41,8 +69,49 @@ def _set_pdeathsig():
         pass
 
 
-def _worker_init():
-    """Initializer for pool worker processes."""
+def _engine_launcher(mem_limit: int) -> list[str]:
+    """Command prefix that starts an engine with its limits already in place.
+
+    setpriv sets PR_SET_PDEATHSIG, so the engine dies with the worker that
+    spawned it, and prlimit sets RLIMIT_AS; each then execs the next command,
+    so both hold from the engine's first instruction. The pool worker itself
+    stays unlimited.
+    """
+    return [
+        shutil.which("setpriv") or "setpriv", "--pdeathsig", "TERM", "--",
+        shutil.which("prlimit") or "prlimit", f"--as={mem_limit}", "--",
+    ]
+
+
+def _worker_init(
+    timeout: int,
+    test262_dir: str,
+    engine_name: str,
+    engine_binary: str,
+    bytecode: bool,
+    scenarios: list[tuple[str, str, dict | None]],
+):
+    """Initializer for pool worker processes.
+
+    The worker itself runs without a memory limit: it inherits the driver's
+    whole address space, which can already exceed an engine's budget. Engines
+    get their limits from the _LAUNCHER prefix instead, which keeps
+    run_single_test free of a preexec_fn, so subprocess stays on its
+    vfork/posix_spawn path (CPython's _USE_POSIX_SPAWN gating) rather than
+    the slow fork+exec one.
+    """
+    global _TIMEOUT, _HARNESS_DIR, _ADAPTER, _CHILD_ENV, _LAUNCHER, _SCENARIOS
+    _TIMEOUT = timeout
+    _HARNESS_DIR = os.path.join(test262_dir, "harness", "")
+    _ADAPTER = make_adapter(engine_name, engine_binary, bytecode=bytecode)
+    _SCENARIOS = scenarios
+    _CHILD_ENV = {**os.environ, "TZ": "UTC"}
+    _LAUNCHER = _engine_launcher(_ADAPTER.mem_limit)
+    for name in ("assert.js", "sta.js"):
+        try:
+            read_harness_file(name)
+        except OSError:
+            pass  # reported per test as a FAIL
     _set_pdeathsig()
     signal.signal(signal.SIGTERM, signal.SIG_DFL)
     signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -60,13 +129,15 @@ def _cleanup_handler(signum, frame):
 
 FRONTMATTER_RE = re.compile(r"/\*---\s*\n(.*?)\n---\*/", re.DOTALL)
 
-FLAGS_RE = re.compile(r"^flags:\s*\[([^\]]*)\]", re.MULTILINE)
-INCLUDES_RE = re.compile(r"^includes:\s*\[([^\]]*)\]", re.MULTILINE)
-NEGATIVE_PHASE_RE = re.compile(
-    r"^negative:\s*\n\s+phase:\s*(\S+)\s*\n\s+type:\s*(\S+)", re.MULTILINE
+# One pass over the frontmatter finds every key parse_frontmatter reads:
+# inline `flags`/`includes`/`features` lists (groups 1-2) and any `negative:`
+# key, whose phase/type groups (3-4) are only set for the usual block form.
+FRONTMATTER_KEYS_RE = re.compile(
+    r"^(?:(flags|includes|features):\s*\[([^\]]*)\]"
+    r"|negative:(?:\s*\n\s+phase:\s*(\S+)\s*\n\s+type:\s*(\S+))?)",
+    re.MULTILINE,
 )
-NEGATIVE_SIMPLE_RE = re.compile(r"^negative:", re.MULTILINE)
-FEATURES_RE = re.compile(r"^features:\s*\[([^\]]*)\]", re.MULTILINE)
+_LIST_KEYS = ("flags", "includes", "features")
 
 
 # ---------------------------------------------------------------------------
@@ -77,15 +148,18 @@ FEATURES_RE = re.compile(r"^features:\s*\[([^\]]*)\]", re.MULTILINE)
 class EngineAdapter(ABC):
     """Abstract base for engine-specific behavior."""
 
+    # RLIMIT_AS for the engine process, set by the launcher before it starts.
+    mem_limit = 512 * 1024 * 1024  # 512 MB
+
     def __init__(self, binary: str):
         self.binary = binary
 
     @abstractmethod
     def build_command(
         self,
-        test_file: Path,
+        test_file: str,
         tmp_path: str | None,
-        harness_files: list[Path],
+        harness_files: list[str],
         is_module: bool,
         flags: list[str] | None = None,
     ) -> list[str]:
@@ -95,6 +169,10 @@ class EngineAdapter(ABC):
     def needs_harness_in_source(self, is_module: bool) -> bool:
         """Whether harness must be concatenated into the source file."""
 
+    def accepts_stdin(self, is_module: bool) -> bool:
+        """Whether the combined source is piped on stdin instead of a temp file."""
+        return False
+
     @abstractmethod
     def is_parse_error(self, exit_code: int, stderr: str) -> bool:
         """Whether the result indicates a parse-phase error."""
@@ -103,12 +181,6 @@ class EngineAdapter(ABC):
     def skip_module(self) -> bool:
         """Whether module tests should be skipped for this engine."""
 
-    def setup_preexec(self):
-        """Pre-exec function for subprocess: memory limit + pdeathsig."""
-        mem_limit = 512 * 1024 * 1024  # 512 MB
-        resource.setrlimit(resource.RLIMIT_AS, (mem_limit, mem_limit))
-        _set_pdeathsig()
-
 
 class JsseAdapter(EngineAdapter):
     def __init__(self, binary: str, bytecode: bool = False):
@@ -121,23 +193,28 @@ class JsseAdapter(EngineAdapter):
             if self.bytecode:
                 cmd.append("--bytecode")
             for hf in harness_files:
-                cmd.extend(["--prelude", str(hf)])
+                cmd.extend(["--prelude", hf])
             if flags and "CanBlockIsTrue" in flags:
                 cmd.append("--can-block")
             cmd.append("--module")
-            cmd.append(str(test_file))
+            cmd.append(test_file)
             return cmd
         cmd = [self.binary]
         if self.bytecode:
             cmd.append("--bytecode")
         if flags and "CanBlockIsTrue" in flags:
             cmd.append("--can-block")
-        cmd.append(tmp_path)
+        # The source arrives on stdin; the test's own path keeps relative
+        # imports resolving against its directory.
+        cmd.extend(["--stdin", test_file])
         return cmd
 
     def needs_harness_in_source(self, is_module):
         return not is_module
 
+    def accepts_stdin(self, is_module):
+        return not is_module
+
     def is_parse_error(self, exit_code, stderr):
         return exit_code == 2
 
@@ -146,9 +223,16 @@ class JsseAdapter(EngineAdapter):
 
 
 class NodeAdapter(EngineAdapter):
+    mem_limit = 4 * 1024 * 1024 * 1024  # 4 GB — V8 needs ~2GB to start
+
+    def __init__(self, binary: str):
+        super().__init__(binary)
+        self.prelude = os.path.join(
+            os.path.dirname(__file__), "node-test262-prelude.js"
+        )
+
     def build_command(self, test_file, tmp_path, harness_files, is_module, flags=None):
-        prelude = Path(__file__).parent / "node-test262-prelude.js"
-        return [self.binary, "--expose-gc", "--require", str(prelude), tmp_path]
+        return [self.binary, "--expose-gc", "--require", self.prelude, tmp_path]
 
     def needs_harness_in_source(self, is_module):
         return True
@@ -159,11 +243,6 @@ class NodeAdapter(EngineAdapter):
     def skip_module(self):
         return True
 
-    def setup_preexec(self):
-        mem_limit = 4 * 1024 * 1024 * 1024  # 4 GB — V8 needs ~2GB to start
-        resource.setrlimit(resource.RLIMIT_AS, (mem_limit, mem_limit))
-        _set_pdeathsig()
-
 
 class BoaAdapter(EngineAdapter):
     def build_command(self, test_file, tmp_path, harness_files, is_module, flags=None):
@@ -182,6 +261,8 @@ class BoaAdapter(EngineAdapter):
 
 
 class Engine262Adapter(EngineAdapter):
+    mem_limit = 4 * 1024 * 1024 * 1024  # 4 GB — engine262 runs on Node
+
     def __init__(self, binary: str):
         super().__init__(binary)
         self.engine262_bin = os.environ.get(
@@ -204,35 +285,25 @@ class Engine262Adapter(EngineAdapter):
     def skip_module(self):
         return False
 
-    def setup_preexec(self):
-        mem_limit = 4 * 1024 * 1024 * 1024  # 4 GB — engine262 runs on Node
-        resource.setrlimit(resource.RLIMIT_AS, (mem_limit, mem_limit))
-        _set_pdeathsig()
-
 
-_ADAPTER_CLASSES = {
-    "jsse": JsseAdapter,
-    "node": NodeAdapter,
-    "boa": BoaAdapter,
-    "engine262": Engine262Adapter,
-}
-
-_DEFAULT_BINARIES = {
-    "jsse": "./target/release/jsse",
-    "node": "node",
-    "boa": "boa",
-    "engine262": "node",
+# Engine name -> (adapter class, default binary).
+_ENGINE_TABLE: dict[str, tuple[type[EngineAdapter], str]] = {
+    "jsse": (JsseAdapter, "./target/release/jsse"),
+    "node": (NodeAdapter, "node"),
+    "boa": (BoaAdapter, "boa"),
+    "engine262": (Engine262Adapter, "node"),
 }
 
 
 def make_adapter(
     engine_name: str, binary: str | None = None, bytecode: bool = False
 ) -> EngineAdapter:
-    cls = _ADAPTER_CLASSES.get(engine_name)
-    if cls is None:
-        raise ValueError(f"Unknown engine: {engine_name}")
+    try:
+        cls, default_binary = _ENGINE_TABLE[engine_name]
+    except KeyError:
+        raise ValueError(f"Unknown engine: {engine_name}") from None
     if binary is None:
-        binary = _DEFAULT_BINARIES[engine_name]
+        binary = default_binary
     if engine_name == "jsse":
         return cls(binary, bytecode=bytecode)
     return cls(binary)
@@ -245,66 +316,154 @@ def make_adapter(
 YAML_LIST_RE = re.compile(r"^(\w+):\s*\n((?:\s+-\s+\S+.*\n?)+)", re.MULTILINE)
 
 
-def _parse_yaml_list(fm: str, field: str) -> list[str] | None:
-    """Parse YAML list format like:
+def _parse_yaml_lists(fm: str) -> dict[str, list[str]]:
+    """Parse every YAML block list, keeping the first one per field:
     field:
       - value1
       - value2
     """
+    lists: dict[str, list[str]] = {}
     for m in YAML_LIST_RE.finditer(fm):
-        if m.group(1) == field:
+        if m.group(1) not in lists:
             items = re.findall(r"^\s+-\s+(.+)$", m.group(2), re.MULTILINE)
-            return [item.strip() for item in items if item.strip()]
-    return None
+            lists[m.group(1)] = [item.strip() for item in items if item.strip()]
+    return lists
 
 
-def parse_frontmatter(text: str) -> dict:
+def read_head(test_file: str | Path) -> str:
+    """Return the first 8 KiB of a test file, which holds its frontmatter.
+
+    Reads just that prefix with a single os.read instead of going through a
+    buffered text file, however large the test is.
+    """
+    fd = os.open(test_file, os.O_RDONLY)
+    try:
+        head = os.read(fd, 8192)
+    finally:
+        os.close(fd)
+    return head.decode("utf-8", errors="replace")
+
+
+def _extract_frontmatter(text: str) -> str | None:
+    """Return the body of the /*--- ... ---*/ block, or None if there is none."""
     # Normalize line endings for frontmatter regex matching
     normalized = text.replace("\r\n", "\n").replace("\r", "\n")
     m = FRONTMATTER_RE.search(normalized)
-    if not m:
+    return m.group(1) if m else None
+
+
+def parse_frontmatter(text: str) -> dict:
+    """Parse a test's frontmatter. The returned dict is shared; don't mutate it."""
+    fm = _extract_frontmatter(text)
+    if fm is None:
         return {}
+    return _parse_fm_body(fm)
 
-    fm = m.group(1)
+
+# Generated tests often share a frontmatter body verbatim, so memoize per body
+# for the life of the process.
+@functools.lru_cache(maxsize=8192)
+def _parse_fm_body(fm: str) -> dict:
     result: dict = {}
 
-    flags_m = FLAGS_RE.search(fm)
-    if flags_m:
-        result["flags"] = [f.strip() for f in flags_m.group(1).split(",") if f.strip()]
-    else:
-        yaml_flags = _parse_yaml_list(fm, "flags")
-        if yaml_flags:
-            result["flags"] = yaml_flags
-
-    includes_m = INCLUDES_RE.search(fm)
-    if includes_m:
-        result["includes"] = [
-            i.strip() for i in includes_m.group(1).split(",") if i.strip()
-        ]
-    else:
-        yaml_includes = _parse_yaml_list(fm, "includes")
-        if yaml_includes:
-            result["includes"] = yaml_includes
-
-    neg_m = NEGATIVE_PHASE_RE.search(fm)
-    if neg_m:
-        result["negative"] = {"phase": neg_m.group(1), "type": neg_m.group(2)}
-    elif NEGATIVE_SIMPLE_RE.search(fm):
-        result["negative"] = {"phase": "runtime", "type": ""}
-
-    features_m = FEATURES_RE.search(fm)
-    if features_m:
-        result["features"] = [
-            f.strip() for f in features_m.group(1).split(",") if f.strip()
-        ]
-    else:
-        yaml_features = _parse_yaml_list(fm, "features")
-        if yaml_features:
-            result["features"] = yaml_features
+    for key_m in FRONTMATTER_KEYS_RE.finditer(fm):
+        key = key_m.group(1) or "negative"
+        if key in result:
+            continue
+        if key != "negative":
+            result[key] = [v.strip() for v in key_m.group(2).split(",") if v.strip()]
+        elif key_m.group(3):
+            result[key] = {"phase": key_m.group(3), "type": key_m.group(4)}
+        else:
+            result[key] = {"phase": "runtime", "type": ""}
+
+    if any(key not in result for key in _LIST_KEYS):
+        yaml_lists = _parse_yaml_lists(fm)
+        for key in _LIST_KEYS:
+            if key not in result and yaml_lists.get(key):
+                result[key] = yaml_lists[key]
 
     return result
 
 
+class FrontmatterCache:
+    """Persistent index of parsed frontmatter, keyed by test path.
+
+    Entries are validated against the file's size and mtime, so warm runs skip
+    reading and parsing the head of every test file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self.entries: dict[str, list] = {}
+        self.dirty = False
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self.entries = entries
+
+    def metadata(self, test_file: str) -> dict | None:
+        """Return test_file's parsed frontmatter, or None if it cannot be read."""
+        key = test_file
+        try:
+            st = os.stat(test_file)
+            entry = self.entries.get(key)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                return entry[2]
+            head = read_head(test_file)
+        except OSError:
+            return None
+        metadata = parse_frontmatter(head)
+        self.entries[key] = [st.st_size, st.st_mtime_ns, metadata]
+        self.dirty = True
+        return metadata
+
+    def size(self, test_file: str) -> int:
+        """Return test_file's size as of its last metadata() call, else 0."""
+        entry = self.entries.get(test_file)
+        return entry[0] if entry else 0
+
+    def prune(self, tests: list[str]) -> None:
+        """Drop entries for files not in tests, e.g. deleted or renamed ones."""
+        keep = set(tests)
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        # A uniquely named temp file, so concurrent runs never write into
+        # each other's copy before it is swapped in.
+        tmp = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.cache_file.parent,
+                prefix=self.cache_file.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                json.dump({"version": self.VERSION, "entries": self.entries}, tmp)
+            os.replace(tmp.name, self.cache_file)
+        except OSError as e:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp.name)
+                except OSError:
+                    pass
+            print(f"Warning: could not write {self.cache_file}: {e}", file=sys.stderr)
+
+
 # ---------------------------------------------------------------------------
 # Scenario computation (dual strict/non-strict per spec)
 # ---------------------------------------------------------------------------
@@ -338,74 +497,96 @@ def compute_scenarios(test_file: str, metadata: dict) -> list[tuple[str, str]]:
     return [(test_file, "default"), (test_file + ":strict", "strict")]
 
 
+def load_timings(timing_file: Path) -> dict[str, float]:
+    """Return per-scenario durations recorded by a previous run, if any."""
+    try:
+        timings = json.loads(timing_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(timings, dict):
+        return {}
+    return {k: v for k, v in timings.items() if isinstance(v, (int, float))}
+
+
 # ---------------------------------------------------------------------------
 # Harness / source building
 # ---------------------------------------------------------------------------
 
 
-def read_harness_file(test262_dir: Path, name: str) -> str:
-    path = test262_dir / "harness" / name
-    with open(path, encoding="utf-8", errors="replace", newline="") as f:
-        return f.read()
+def read_harness_file(name: str) -> bytes:
+    source = _HARNESS_CACHE.get(name)
+    if source is None:
+        with open(_HARNESS_DIR + name, "rb") as f:
+            source = f.read()
+        _HARNESS_CACHE[name] = source
+    return source
 
 
-def get_harness_files(
-    metadata: dict, test262_dir: Path, is_module: bool, is_async: bool
-) -> list[Path]:
-    """Get list of harness files needed for a test."""
+def get_harness_files(metadata: dict, is_async: bool) -> list[str]:
+    """Get list of harness file paths needed for a test."""
     flags = metadata.get("flags", [])
     harness_files = []
 
     if "raw" not in flags:
-        harness_files.append(test262_dir / "harness" / "assert.js")
-        harness_files.append(test262_dir / "harness" / "sta.js")
+        harness_files.append(_HARNESS_DIR + "assert.js")
+        harness_files.append(_HARNESS_DIR + "sta.js")
 
         if is_async:
-            harness_files.append(test262_dir / "harness" / "doneprintHandle.js")
+            harness_files.append(_HARNESS_DIR + "doneprintHandle.js")
 
         for inc in metadata.get("includes", []):
-            harness_files.append(test262_dir / "harness" / inc)
+            harness_files.append(_HARNESS_DIR + inc)
 
     return harness_files
 
 
+@functools.lru_cache(maxsize=2)
+def _read_test_file(test_file: str) -> bytes:
+    """Read a test file, remembering the last couple per worker.
+
+    The default and strict scenarios of a file usually sit next to each other
+    in the scenario order and so land in the same chunk; the second one then
+    reuses the first one's read.
+    """
+    with open(test_file, "rb") as f:
+        return f.read()
+
+
 def build_test_source(
-    test_file: Path,
+    test_file: str,
     metadata: dict,
-    test262_dir: Path,
     mode: str,
-) -> str:
+) -> bytes:
     """Build the full source to feed to the engine, prepending harness files.
 
     mode is one of "default", "strict", "module".
     For modules with jsse, harness is loaded via --prelude instead.
+    Files are concatenated as raw bytes; nothing here needs them decoded.
     """
     flags = metadata.get("flags", [])
     is_async = "async" in flags
 
+    source = _read_test_file(test_file)
     if mode == "module":
-        with open(test_file, encoding="utf-8", errors="replace", newline="") as f:
-            return f.read()
+        return source
 
-    parts: list[str] = []
-    with open(test_file, encoding="utf-8", errors="replace", newline="") as f:
-        source = f.read()
+    parts: list[bytes] = []
 
     if mode == "strict":
-        parts.append('"use strict";\n')
+        parts.append(b'"use strict";\n')
 
     if "raw" not in flags:
-        parts.append(read_harness_file(test262_dir, "assert.js"))
-        parts.append(read_harness_file(test262_dir, "sta.js"))
+        parts.append(read_harness_file("assert.js"))
+        parts.append(read_harness_file("sta.js"))
 
         if is_async:
-            parts.append(read_harness_file(test262_dir, "doneprintHandle.js"))
+            parts.append(read_harness_file("doneprintHandle.js"))
 
         for inc in metadata.get("includes", []):
-            parts.append(read_harness_file(test262_dir, inc))
+            parts.append(read_harness_file(inc))
 
     parts.append(source)
-    return "\n".join(parts)
+    return b"\n".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -413,37 +594,32 @@ def build_test_source(
 # ---------------------------------------------------------------------------
 
 
-def run_single_test(
-    args: tuple[str, str, str, int, str, str, str],
-) -> tuple[str, bool, str, float]:
+def run_single_test(index: int) -> tuple[str, int, float]:
     """Run a single test scenario.
 
-    Args tuple: (scenario_id, test_file_str, mode, timeout, test262_dir_str,
-                  engine_name, engine_binary, bytecode)
-    Returns: (scenario_id, passed, skip_reason, duration_secs)
+    Every scenario gets a fresh engine process. That is deliberate: the memory
+    limit and timeout apply per test, a crash or hang only costs that test, and
+    no engine state (realms, agent threads, interned keys) leaks between tests.
+    Startup cost is amortized by running many processes in parallel instead.
+
+    index selects (scenario_id, mode, metadata) from _SCENARIOS, where
+    metadata is the parsed frontmatter from the main process's prescan, or
+    None if the file could not be read. The test path is the scenario_id minus
+    any ":strict" suffix, and the per-run settings come from the globals set
+    by _worker_init.
+    Returns: (scenario_id, status, duration_secs), status being PASS, FAIL,
+    SKIP or ERROR. Read and harness errors and timeouts count as FAIL; ERROR
+    means the engine could not be started at all.
     """
-    (
-        scenario_id,
-        test_file_str,
-        mode,
-        timeout,
-        test262_dir_str,
-        engine_name,
-        engine_binary,
-        bytecode,
-    ) = args
-    test_file = Path(test_file_str)
-    test262_dir = Path(test262_dir_str)
-
-    adapter = make_adapter(engine_name, engine_binary, bytecode=bytecode)
+    scenario_id, mode, metadata = _SCENARIOS[index]
+    test_file = scenario_id.removesuffix(":strict")
+    timeout = _TIMEOUT
 
-    try:
-        with open(test_file, encoding="utf-8", errors="replace", newline="") as f:
-            head = f.read(8192)
-    except OSError:
-        return (scenario_id, False, "read_error", 0.0)
+    adapter = _ADAPTER
+
+    if metadata is None:
+        return (scenario_id, FAIL, 0.0)
 
-    metadata = parse_frontmatter(head)
     flags = metadata.get("flags", [])
 
     is_module = mode == "module"
@@ -451,42 +627,57 @@ def run_single_test(
     negative = metadata.get("negative")
 
     if is_module and adapter.skip_module():
-        return (scenario_id, False, "skip_module", 0.0)
+        return (scenario_id, SKIP, 0.0)
 
-    harness_files = get_harness_files(metadata, test262_dir, is_module, is_async)
+    harness_files = get_harness_files(metadata, is_async)
     concat_harness = adapter.needs_harness_in_source(is_module)
 
     tmp_path = None
+    stdin_source = None
     if concat_harness or not is_module:
         try:
-            combined = build_test_source(test_file, metadata, test262_dir, mode)
+            combined = build_test_source(test_file, metadata, mode)
         except OSError:
-            return (scenario_id, False, "harness_error", 0.0)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".js",
-            delete=False,
-            encoding="utf-8",
-            newline="",
-            dir=str(test_file.parent),
-        ) as tmp:
-            tmp.write(combined)
-            tmp_path = tmp.name
+            return (scenario_id, FAIL, 0.0)
+
+        if adapter.accepts_stdin(is_module):
+            stdin_source = combined
+        else:
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                suffix=".js",
+                delete=False,
+                dir=os.path.dirname(test_file) or ".",
+            ) as tmp:
+                tmp.write(combined)
+                tmp_path = tmp.name
 
     cmd = adapter.build_command(test_file, tmp_path, harness_files, is_module, flags)
 
+    # Only keep the output streams the verdict below actually reads; the rest
+    # go to /dev/null so passing tests cost no pipes or buffering.
+    neg_phase = negative.get("phase", "runtime") if negative else None
+    want_stdout = is_async or neg_phase == "resolution"
+    want_stderr = neg_phase in ("parse", "resolution")
+
     t0 = time.perf_counter()
     try:
         result = subprocess.run(
-            cmd,
+            _LAUNCHER + cmd,
+            input=stdin_source,
             timeout=timeout,
-            capture_output=True,
-            env={**os.environ, "TZ": "UTC"},
-            preexec_fn=adapter.setup_preexec,
+            stdout=subprocess.PIPE if want_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if want_stderr else subprocess.DEVNULL,
+            env=_CHILD_ENV,
+            # No preexec_fn/cwd and close_fds=False keep subprocess on its
+            # vfork/posix_spawn path; Python's own fds are non-inheritable.
+            close_fds=False,
         )
         duration = time.perf_counter() - t0
         exit_code = result.returncode
+        # prlimit's own exit status when it cannot exec the engine.
+        if exit_code in (126, 127):
+            return (scenario_id, ERROR, duration)
     except subprocess.TimeoutExpired:
         duration = time.perf_counter() - t0
         if tmp_path:
@@ -494,7 +685,7 @@ def run_single_test(
                 os.unlink(tmp_path)
             except OSError:
                 pass
-        return (scenario_id, False, "timeout", duration)
+        return (scenario_id, FAIL, duration)
     except OSError:
         duration = time.perf_counter() - t0
         if tmp_path:
@@ -502,7 +693,7 @@ def run_single_test(
                 os.unlink(tmp_path)
             except OSError:
                 pass
-        return (scenario_id, False, "exec_error", duration)
+        return (scenario_id, ERROR, duration)
     finally:
         if tmp_path:
             try:
@@ -510,31 +701,38 @@ def run_single_test(
             except OSError:
                 pass
 
-    stderr_text = result.stderr.decode("utf-8", errors="replace")
-
+    # The verdicts below only look for short markers, so search the raw bytes
+    # and decode at most a bounded prefix of stderr (the error message comes
+    # first; whatever stack trace follows is never looked at).
     if negative:
-        phase = negative.get("phase", "runtime")
+        phase = neg_phase
         neg_type = negative.get("type", "")
         if phase == "parse":
+            stderr_text = result.stderr[:_STDERR_DECODE_LIMIT].decode(
+                "utf-8", errors="replace"
+            )
             passed = adapter.is_parse_error(exit_code, stderr_text)
         elif phase == "resolution":
-            stdout_text = result.stdout.decode("utf-8", errors="replace")
-            output = stdout_text + stderr_text
-            passed = exit_code != 0 and neg_type != "" and neg_type in output
+            marker = neg_type.encode()
+            passed = (
+                exit_code != 0
+                and neg_type != ""
+                and (marker in result.stdout or marker in result.stderr)
+            )
         else:
             passed = exit_code != 0
     elif is_async:
-        stdout = result.stdout.decode("utf-8", errors="replace")
-        if "Test262:AsyncTestFailure" in stdout:
+        stdout = result.stdout
+        if b"Test262:AsyncTestFailure" in stdout:
             passed = False
-        elif "Test262:AsyncTestComplete" in stdout:
+        elif b"Test262:AsyncTestComplete" in stdout:
             passed = exit_code == 0
         else:
             passed = False
     else:
         passed = exit_code == 0
 
-    return (scenario_id, passed, "", duration)
+    return (scenario_id, PASS if passed else FAIL, duration)
 
 
 # ---------------------------------------------------------------------------
@@ -642,51 +840,74 @@ examples:
     return parser.parse_args()
 
 
-def _is_fixture(p: Path) -> bool:
-    name = p.name
+def _is_fixture(name: str) -> bool:
     return name.endswith("_FIXTURE.js") or name.endswith("_FIXTURE.mjs")
 
 
-def find_tests(test262_dir: Path, paths: list[str] | None) -> list[Path]:
+def _walk_tests(root: str) -> Iterator[str]:
+    """Yield the non-fixture .js files under root as plain path strings.
+
+    os.scandir reports entry types from the directory listing, so the walk
+    needs no per-file stat and builds no Path objects.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".js") and not _is_fixture(entry.name):
+                    yield entry.path
+
+
+def _path_order(path: str) -> str:
+    # Order component-wise, the way Path objects compare, so test order (and
+    # with it --sample --seed selections) is independent of the walk order.
+    # Mapping the separator to NUL, which sorts before any name character,
+    # gives that order with a plain string comparison.
+    return path.replace(os.sep, "\0")
+
+
+def find_tests(test262_dir: Path, paths: list[str] | None) -> list[str]:
+    tests: list[str] = []
     if paths:
-        tests = []
         for p in paths:
-            path = Path(p)
-            if path.is_file() and path.suffix == ".js":
-                tests.append(path)
-            elif path.is_dir():
-                tests.extend(
-                    f for f in sorted(path.rglob("*.js")) if not _is_fixture(f)
-                )
-        return sorted(tests)
+            p = os.path.normpath(p)
+            if os.path.isfile(p) and p.endswith(".js"):
+                tests.append(p)
+            elif os.path.isdir(p):
+                tests.extend(_walk_tests(p))
+        tests.sort(key=_path_order)
+        return tests
 
     test_dir = test262_dir / "test"
-    tests = []
     for subdir in ("language", "built-ins", "annexB", "intl402"):
-        d = test_dir / subdir
-        if d.is_dir():
-            tests.extend(f for f in d.rglob("*.js") if not _is_fixture(f))
-    return sorted(tests)
+        d = os.path.join(test_dir, subdir)
+        if os.path.isdir(d):
+            tests.extend(_walk_tests(d))
+    tests.sort(key=_path_order)
+    return tests
 
 
-def sample_tests(tests: list[Path], rate: float, seed: int | None) -> list[Path]:
+def sample_tests(tests: list[str], rate: float, seed: int | None) -> list[str]:
     """Return a stratified random sample of tests.
 
     Tests are grouped by their parent directory so that every directory
     contributes proportionally.  At least one test is kept per directory.
     """
     rng = random.Random(seed)
-    by_dir: dict[Path, list[Path]] = {}
+    by_dir: dict[str, list[str]] = {}
     for t in tests:
-        by_dir.setdefault(t.parent, []).append(t)
+        by_dir.setdefault(os.path.dirname(t), []).append(t)
 
-    sampled: list[Path] = []
+    sampled: list[str] = []
     for dir_tests in by_dir.values():
         k = max(1, math.ceil(len(dir_tests) * rate))
         k = min(k, len(dir_tests))
         sampled.extend(rng.sample(dir_tests, k))
 
-    return sorted(sampled)
+    sampled.sort(key=_path_order)
+    return sampled
 
 
 def main():
@@ -708,12 +929,10 @@ def main():
     if binary is None and args.jsse_compat is not None and engine_name == "jsse":
         binary = args.jsse_compat
     if binary is None:
-        binary = _DEFAULT_BINARIES[engine_name]
+        binary = _ENGINE_TABLE[engine_name][1]
 
     binary_path = Path(binary)
     if not binary_path.is_file():
-        import shutil
-
         found = shutil.which(binary)
         if found:
             binary_path = Path(found)
@@ -722,6 +941,10 @@ def main():
             print("Build it first: cargo build --release", file=sys.stderr)
             sys.exit(2)
 
+    if not (shutil.which("setpriv") and shutil.which("prlimit")):
+        print("Error: setpriv and prlimit (util-linux) are required", file=sys.stderr)
+        sys.exit(2)
+
     test262 = Path(args.test262)
     if not (test262 / "test").is_dir():
         print(f"Error: test262 directory not found at {test262}", file=sys.stderr)
@@ -755,17 +978,49 @@ def main():
         print("No tests found.")
         sys.exit(1)
 
-    # Expand files into scenarios (dual strict/non-strict per spec)
-    scenarios = []
-    for t in tests:
-        try:
-            with open(t, encoding="utf-8", errors="replace", newline="") as f:
-                head = f.read(8192)
-        except OSError:
-            scenarios.append((str(t), "default"))
+    # Expand files into scenarios (dual strict/non-strict per spec). The
+    # stat/head reads are I/O bound, so a thread pool overlaps them; the parsed
+    # metadata then travels with each scenario so workers don't redo it.
+    # The threads leave per-thread malloc arenas behind, hundreds of MB of
+    # address space that every forked worker inherits; that is why the engine
+    # memory limit goes on each engine rather than on the workers.
+    fm_cache = FrontmatterCache(Path(".test262_cache.json"))
+    with ThreadPoolExecutor() as prescan:
+        all_metadata = list(prescan.map(fm_cache.metadata, tests))
+    if not selected_paths and not is_sample_run:
+        # Only a run over the whole suite knows which tests still exist.
+        fm_cache.prune(tests)
+    fm_cache.save()
+    scenarios: list[tuple[str, str, dict | None]] = []
+    for t, metadata in zip(tests, all_metadata):
+        if metadata is None:
+            scenarios.append((t, "default", None))
             continue
-        metadata = parse_frontmatter(head)
-        scenarios.extend(compute_scenarios(str(t), metadata))
+        scenarios.extend(
+            (scenario_id, mode, metadata)
+            for scenario_id, mode in compute_scenarios(t, metadata)
+        )
+
+    # Longest first: start what was slowest last run (files with no recorded
+    # time first, largest files first) so a few slow tests don't end up
+    # running alone at the end. Files are ranked by their slowest scenario so
+    # a file's default and strict scenarios stay adjacent and usually share a
+    # worker (and its _read_test_file cache).
+    timing_file = Path(f"/tmp/timing-{engine_name}.json")
+    previous_timings = load_timings(timing_file)
+    file_times: dict[str, float] = {}
+    for scenario_id, _, _ in scenarios:
+        path = scenario_id.removesuffix(":strict")
+        t = previous_timings.get(scenario_id, math.inf)
+        if t > file_times.get(path, -1.0):
+            file_times[path] = t
+    scenarios.sort(
+        key=lambda s: (
+            file_times[s[0].removesuffix(":strict")],
+            fm_cache.size(s[0].removesuffix(":strict")),
+        ),
+        reverse=True,
+    )
 
     total = len(scenarios)
     resolved_binary = str(binary_path.resolve())
@@ -777,51 +1032,55 @@ def main():
         file=sys.stderr,
     )
 
-    passed = 0
-    failed = 0
-    skipped = 0
     done = 0
-    pass_list: list[str] = []
-    fail_list: list[str] = []
+    next_report = 1000
+    # Scenario ids per outcome, indexed by PASS/FAIL/SKIP/ERROR.
+    results: tuple[list[str], ...] = ([], [], [], [])
     timings: dict[str, float] = {}
 
-    work = [
-        (
-            scenario_id,
-            scenario_id.removesuffix(":strict"),  # test_file_str
-            mode,
+    # Hand out work in chunks so each worker round trip covers many scenarios,
+    # and take results in completion order so one slow test doesn't hold back
+    # progress reporting. ~32 chunks per worker keeps the tail short when a
+    # chunk happens to collect several slow tests.
+    chunksize = max(1, total // (args.jobs * 32))
+    # Fork explicitly (rather than the platform default, which is forkserver
+    # on newer Pythons) so workers start from the already-imported module,
+    # compiled regexes and all, instead of re-importing the script. Under fork
+    # the initargs, including the scenario table, are inherited, not pickled.
+    with multiprocessing.get_context("fork").Pool(
+        args.jobs,
+        initializer=_worker_init,
+        initargs=(
             args.timeout,
             resolved_test262,
             engine_name,
             resolved_binary,
             args.bytecode,
-        )
-        for scenario_id, mode in scenarios
-    ]
-
-    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_worker_init) as pool:
-        futures = {pool.submit(run_single_test, w): w for w in work}
-        for future in as_completed(futures):
-            scenario_id, test_passed, skip_reason, duration = future.result()
+            scenarios,
+        ),
+    ) as pool:
+        for result in pool.imap_unordered(run_single_test, range(total), chunksize):
+            scenario_id, status, duration = result
             done += 1
-            if skip_reason.startswith("skip_"):
-                skipped += 1
-            elif test_passed:
-                passed += 1
-                pass_list.append(scenario_id)
-            else:
-                failed += 1
-                fail_list.append(scenario_id)
-            if not skip_reason.startswith("skip_"):
+            results[status].append(scenario_id)
+            if status in (PASS, FAIL):
                 timings[scenario_id] = round(duration, 3)
-            if done % 1000 == 0:
-                run = passed + failed
+            if done >= next_report:
+                next_report = done + 1000
+                passed = len(results[PASS])
+                run = passed + len(results[FAIL])
                 pct = (passed / run * 100) if run else 0
                 print(
                     f"... {done}/{total} ({pct:.1f}% passing of {run} run)",
                     file=sys.stderr,
                 )
 
+    pass_set = set(results[PASS])
+    fail_list = results[FAIL]
+    passed = len(pass_set)
+    failed = len(fail_list)
+    skipped = len(results[SKIP])
+    errors = sorted(results[ERROR])
     run_total = passed + failed
     percentage = (passed / run_total * 100) if run_total else 0
 
@@ -837,27 +1096,29 @@ def main():
     # feature branches don't conflict on test262-pass.txt.
     regressions: list[str] = []
     new_passes: list[str] = []
-    ran_tests = set(pass_list + fail_list)
     is_full_run = not args.paths
     baseline_source = None
-    baseline_text: str | None = None
+    baseline: set[str] | None = None
     if engine_name == "jsse":
         try:
             baseline_text = subprocess.check_output(
                 ["git", "show", f"{args.baseline_ref}:{baseline_file}"],
                 stderr=subprocess.DEVNULL,
             ).decode("utf-8")
+            baseline = set(filter(None, baseline_text.splitlines()))
             baseline_source = f"{args.baseline_ref}:{baseline_file}"
         except (subprocess.CalledProcessError, FileNotFoundError):
-            baseline_text = None
-    if baseline_text is None and baseline_file.exists():
-        baseline_text = baseline_file.read_text()
+            pass
+    if baseline is None and baseline_file.exists():
+        # Stream the file rather than holding its text alongside the set.
+        with baseline_file.open(encoding="utf-8") as f:
+            baseline = {line for line in map(str.rstrip, f) if line}
         baseline_source = str(baseline_file)
-    if baseline_text is not None:
-        baseline = {line for line in baseline_text.strip().split("\n") if line}
-        current = set(pass_list)
-        regressions = sorted((baseline & ran_tests) - current)
-        new_passes = sorted(current - baseline)
+    if baseline is not None:
+        # Every scenario that ran either passed or failed, so the baseline
+        # entries that regressed are exactly those among this run's failures.
+        regressions = sorted(baseline.intersection(fail_list))
+        new_passes = sorted(pass_set - baseline)
 
     print()
     print("=== test262 Results ===")
@@ -875,10 +1136,13 @@ def main():
     print(f"Pass:    {passed}")
     print(f"Fail:    {failed}")
     print(f"Rate:    {percentage:.2f}%")
+    if errors:
+        print(f"Errors:  {len(errors)}")
 
+    fail_list.sort()
     if fail_list:
         print(f"\n--- Failures: {len(fail_list)} tests ---")
-        for f in sorted(fail_list)[:20]:
+        for f in fail_list[:20]:
             print(f"  FAILED: {f}")
         if len(fail_list) > 20:
             print(f"  ... and {len(fail_list) - 20} more")
@@ -895,17 +1159,28 @@ def main():
     if new_passes:
         print(f"\nNew passes: {len(new_passes)}")
 
+    if errors:
+        print(f"\n!!! ERRORS: {len(errors)} scenarios could not be run:")
+        for e in errors[:20]:
+            print(f"  ERROR: {e}")
+        if len(errors) > 20:
+            print(f"  ... and {len(errors) - 20} more")
+
     if is_full_run and not is_sample_run:
-        pass_list.sort()
-        if engine_name != "jsse" or args.update_baseline:
-            baseline_file.write_text("\n".join(pass_list) + "\n")
+        if errors:
+            # Errored scenarios are in neither list; rewriting the baseline
+            # would silently drop them from it.
+            print(f"\n(baseline unchanged: {len(errors)} scenarios did not run)")
+        elif engine_name != "jsse" or args.update_baseline:
+            with baseline_file.open("w", encoding="utf-8") as f:
+                f.writelines(p + "\n" for p in sorted(pass_set))
         elif regressions or new_passes:
             print(
                 f"\n(baseline unchanged; pass --update-baseline to rewrite {baseline_file})"
             )
 
-    fail_list.sort()
-    fail_file.write_text("\n".join(fail_list) + "\n")
+    with fail_file.open("w", encoding="utf-8") as f:
+        f.writelines(p + "\n" for p in fail_list)
 
     # Print 10 slowest tests
     if timings:
@@ -915,7 +1190,6 @@ def main():
             print(f"  {dur:7.3f}s  {sid}")
 
     # Write timing JSON
-    timing_file = Path(f"/tmp/timing-{engine_name}.json")
     timing_file.write_text(json.dumps(timings, indent=2) + "\n")
     print(f"\nTiming data written to {timing_file}")
 
@@ -931,6 +1205,7 @@ def main():
         "percentage": round(percentage, 2),
         "regressions": len(regressions),
         "new_passes": len(new_passes),
+        "errors": len(errors),
     }
     print(f"JSON: {json.dumps(json_obj)}")
 
@@ -942,6 +1217,13 @@ def main():
             file=sys.stderr,
         )
         should_fail = True
+    if errors:
+        print(
+            f"Error: {len(errors)} test262 scenario(s) could not be run "
+            "(the engine failed to start).",
+            file=sys.stderr,
+        )
+        should_fail = True
     if args.fail_on_failures and failed:
         print(
             f"Error: {failed} test262 scenario(s) failed.",
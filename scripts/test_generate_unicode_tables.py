@@ -0,0 +1,84 @@
+import importlib.util
+import random
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+GENERATOR = REPO_ROOT / "scripts" / "generate_unicode_tables.py"
+
+
+def load_generator():
+    spec = importlib.util.spec_from_file_location("generate_unicode_tables", GENERATOR)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_ranges(rng: random.Random, count: int, limit: int) -> list[tuple[int, int]]:
+    ranges = []
+    for _ in range(count):
+        lo = rng.randrange(limit)
+        ranges.append((lo, min(limit - 1, lo + rng.randrange(8))))
+    return ranges
+
+
+def code_points(ranges: list[tuple[int, int]]) -> set[int]:
+    return {cp for lo, hi in ranges for cp in range(lo, hi + 1)}
+
+
+class RangeArithmeticTests(unittest.TestCase):
+    def setUp(self):
+        self.gen = load_generator()
+        self.rng = random.Random(262)
+
+    def assert_canonical(self, ranges: list[tuple[int, int]]):
+        # Sorted, non-empty, and neither overlapping nor adjacent.
+        for lo, hi in ranges:
+            self.assertLessEqual(lo, hi)
+        for (_, prev_hi), (lo, _) in zip(ranges, ranges[1:]):
+            self.assertGreater(lo, prev_hi + 1)
+
+    def test_merge_ranges_matches_brute_force(self):
+        for _ in range(500):
+            ranges = sorted(random_ranges(self.rng, self.rng.randrange(12), 64))
+
+            merged = self.gen.merge_ranges(ranges)
+
+            self.assert_canonical(merged)
+            self.assertEqual(code_points(merged), code_points(ranges))
+
+    def test_merge_ranges_joins_adjacent_and_nested_ranges(self):
+        self.assertEqual(self.gen.merge_ranges([]), [])
+        self.assertEqual(
+            self.gen.merge_ranges([(0, 4), (1, 2), (5, 5), (7, 9), (8, 8)]),
+            [(0, 5), (7, 9)],
+        )
+
+    def test_subtract_ranges_matches_brute_force(self):
+        for _ in range(500):
+            ranges = self.gen.merge_ranges(
+                sorted(random_ranges(self.rng, self.rng.randrange(12), 64))
+            )
+            remove = self.gen.merge_ranges(
+                sorted(random_ranges(self.rng, self.rng.randrange(12), 64))
+            )
+
+            result = self.gen.subtract_ranges(ranges, remove)
+
+            self.assert_canonical(result)
+            self.assertEqual(
+                code_points(result), code_points(ranges) - code_points(remove)
+            )
+
+    def test_subtract_ranges_splits_around_removed_ranges(self):
+        self.assertEqual(self.gen.subtract_ranges([(0, 9)], []), [(0, 9)])
+        self.assertEqual(self.gen.subtract_ranges([(0, 9)], [(0, 9)]), [])
+        self.assertEqual(
+            self.gen.subtract_ranges([(0, 9), (20, 29)], [(3, 4), (9, 21), (25, 25)]),
+            [(0, 2), (5, 8), (22, 24), (26, 29)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
+import copy
+import importlib.util
+import itertools
+import json
 import os
+import random
 import stat
 import subprocess
 import sys
@@ -12,6 +17,13 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 RUNNER = REPO_ROOT / "scripts" / "run-test262.py"
 
 
+def load_runner():
+    spec = importlib.util.spec_from_file_location("run_test262", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class RunTest262ExitStatusTests(unittest.TestCase):
     def setUp(self):
         self.tmp = tempfile.TemporaryDirectory()
@@ -49,10 +61,13 @@ class RunTest262ExitStatusTests(unittest.TestCase):
         engine.chmod(engine.stat().st_mode | stat.S_IXUSR)
         return engine
 
-    def run_runner(self, engine: Path, *extra_args: str) -> subprocess.CompletedProcess:
+    def run_runner(
+        self, engine: Path, *extra_args: str, python_args: tuple[str, ...] = ()
+    ) -> subprocess.CompletedProcess:
         return subprocess.run(
             [
                 sys.executable,
+                *python_args,
                 str(RUNNER),
                 "--jsse",
                 str(engine),
@@ -98,6 +113,17 @@ class RunTest262ExitStatusTests(unittest.TestCase):
         self.assertIn("REGRESSED: test262/test/sample.js", result.stdout)
         self.assertIn("Error: 1 baseline regression(s) detected.", result.stderr)
 
+    def test_engine_spawn_failures_are_reported_as_errors(self):
+        engine = self.write_engine(0)
+        engine.chmod(0o644)
+
+        result = self.run_runner(engine)
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Fail:    0", result.stdout)
+        self.assertIn("ERROR: test262/test/sample.js", result.stdout)
+        self.assertIn("Error: 1 test262 scenario(s) could not be run", result.stderr)
+
     def test_child_engine_runs_in_utc(self):
         engine = self.root / "engine_timezone.py"
         engine.write_text(
@@ -117,6 +143,184 @@ class RunTest262ExitStatusTests(unittest.TestCase):
 
         self.assertEqual(result.returncode, 0)
 
+    def test_engine_starts_with_its_limits_in_place(self):
+        # boa reads the test from a file argument, so nothing in the runner
+        # waits on the engine: the limits must hold from its first instruction.
+        engine = self.root / "engine_limits.py"
+        engine.write_text(
+            textwrap.dedent(
+                f"""\
+                #!{sys.executable}
+                import ctypes
+                import resource
+                import signal
+                import sys
+                pdeathsig = ctypes.c_int()
+                ctypes.CDLL(None).prctl(2, ctypes.byref(pdeathsig))  # PR_GET_PDEATHSIG
+                limited = resource.getrlimit(resource.RLIMIT_AS) == (512 * 1024 * 1024,) * 2
+                sys.exit(0 if limited and pdeathsig.value == signal.SIGTERM else 1)
+                """
+            ),
+            encoding="utf-8",
+        )
+        engine.chmod(engine.stat().st_mode | stat.S_IXUSR)
+
+        result = self.run_runner(
+            engine, "--engine", "boa", "--binary", str(engine), "--fail-on-failures"
+        )
+
+        self.assertEqual(result.returncode, 0)
+
+    def test_frontmatter_cache_is_reused_while_file_is_unchanged(self):
+        engine = self.write_engine(0)
+        self.run_runner(engine)
+        cache_file = self.root / ".test262_cache.json"
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        entry = cache["entries"]["test262/test/sample.js"]
+        self.assertEqual(entry[2], {"flags": ["raw"]})
+
+        # A stale-looking but still size/mtime-valid entry must be trusted...
+        entry[2] = {}
+        cache_file.write_text(json.dumps(cache), encoding="utf-8")
+        result = self.run_runner(engine)
+        self.assertIn("Scenarios: 2", result.stdout)
+
+        # ...and invalidated as soon as the file changes.
+        self.test_file.write_text("/*---\nflags: [raw]\n---*/\n\n", encoding="utf-8")
+        result = self.run_runner(engine)
+        self.assertIn("Scenarios: 1", result.stdout)
+
+    def test_frontmatter_cache_prunes_tests_that_are_gone(self):
+        runner = load_runner()
+        other = self.test_file.with_name("other.js")
+        other.write_text("/*---\nflags: [onlyStrict]\n---*/\n", encoding="utf-8")
+        cache_file = self.root / ".test262_cache.json"
+        cache = runner.FrontmatterCache(cache_file)
+        cache.metadata(str(self.test_file))
+        cache.metadata(str(other))
+        cache.save()
+
+        cache = runner.FrontmatterCache(cache_file)
+        cache.prune([str(self.test_file)])
+        cache.save()
+
+        entries = json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+        self.assertEqual(list(entries), [str(self.test_file)])
+        self.assertEqual(list(self.root.glob("*.tmp")), [])
+
+    def test_forked_worker_with_large_heap_can_spawn(self):
+        # Stands in for a driver whose address space outgrew the engine's
+        # memory limit before the pool forked, e.g. through the malloc arenas
+        # the threaded frontmatter prescan leaves behind.
+        bootstrap = textwrap.dedent(
+            """\
+            import mmap, runpy, sys
+            ballast = mmap.mmap(-1, 1024 * 1024 * 1024)
+            sys.argv = sys.argv[1:]
+            runpy.run_path(sys.argv[0], run_name="__main__")
+            """
+        )
+
+        result = self.run_runner(self.write_engine(0), python_args=("-c", bootstrap))
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Pass:    1", result.stdout)
+
+
+
+class FrontmatterParsingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = load_runner()
+
+    def parse(self, body: str) -> dict:
+        return self.runner.parse_frontmatter(f"/*---\n{body}\n---*/\nfoo();\n")
+
+    def test_inline_lists(self):
+        metadata = self.parse(
+            "description: x\n"
+            "flags: [onlyStrict, async]\n"
+            "includes: [compareArray.js, propertyHelper.js]\n"
+            "features: [Symbol, BigInt]"
+        )
+
+        self.assertEqual(
+            metadata,
+            {
+                "flags": ["onlyStrict", "async"],
+                "includes": ["compareArray.js", "propertyHelper.js"],
+                "features": ["Symbol", "BigInt"],
+            },
+        )
+
+    def test_multiline_lists(self):
+        metadata = self.parse(
+            "includes:\n  - compareArray.js\n  - deepEqual.js\nflags:\n  - module"
+        )
+
+        self.assertEqual(
+            metadata,
+            {"flags": ["module"], "includes": ["compareArray.js", "deepEqual.js"]},
+        )
+
+    def test_negative_phase_and_type(self):
+        for phase, neg_type in (
+            ("parse", "SyntaxError"),
+            ("resolution", "ReferenceError"),
+        ):
+            with self.subTest(phase=phase):
+                metadata = self.parse(
+                    f"description: x\nnegative:\n  phase: {phase}\n  type: {neg_type}"
+                )
+
+                self.assertEqual(
+                    metadata, {"negative": {"phase": phase, "type": neg_type}}
+                )
+
+    def test_missing_keys_are_absent(self):
+        self.assertEqual(self.parse("description: no flags, includes or features"), {})
+        self.assertEqual(self.parse("includes: []"), {"includes": []})
+        self.assertEqual(self.runner.parse_frontmatter("foo();\n"), {})
+
+    def test_key_regex_only_matches_at_line_start(self):
+        body = "description: mentions flags: [raw] inline\ninfo: |\n  includes: [x.js]"
+
+        self.assertEqual(list(self.runner.FRONTMATTER_KEYS_RE.finditer(body)), [])
+        self.assertEqual(self.runner._parse_fm_body(body), {})
+
+    def test_callers_leave_the_shared_result_untouched(self):
+        body = (
+            "flags: [async]\n"
+            "includes: [compareArray.js]\n"
+            "negative:\n  phase: parse\n  type: SyntaxError"
+        )
+        metadata = self.parse(body)
+        expected = copy.deepcopy(metadata)
+
+        self.runner.compute_scenarios("t.js", metadata)
+        self.runner.get_harness_files(metadata, is_async=True)
+        self.runner.JsseAdapter("jsse").build_command(
+            "t.js", None, [], False, metadata["flags"]
+        )
+
+        self.assertIs(self.parse(body), metadata)
+        self.assertEqual(metadata, expected)
+
+
+class TestOrderTests(unittest.TestCase):
+    def test_path_order_matches_sorting_path_objects(self):
+        runner = load_runner()
+        names = ["a", "a-b", "a.b", "a_b", "a.js", "a-b.js", "a_b.js", "ab"]
+        paths = [
+            os.path.join("test", *parts)
+            for parts in itertools.product(names, repeat=2)
+        ]
+        random.Random(262).shuffle(paths)
+
+        self.assertEqual(
+            sorted(paths, key=runner._path_order),
+            [str(p) for p in sorted(Path(p) for p in paths)],
+        )
 
 if __name__ == "__main__":
     unittest.main()
@@ -1176,12 +1176,14 @@ fn parse_v_class_atom(chars: &[char], i: &mut usize, flags: &str) -> Result<VCla
                     }
                     // Regular property
                     if let Some(ranges) = crate::unicode_tables::lookup_property(&content) {
+                        let complemented: Vec<(u32, u32)>;
                         let ranges_to_use = if negated {
-                            complement_ranges(ranges)
+                            complemented = complement_ranges(ranges);
+                            &complemented[..]
                         } else {
-                            ranges.to_vec()
+                            ranges
                         };
-                        for &(lo, hi) in &ranges_to_use {
+                        for &(lo, hi) in ranges_to_use {
                             result.add_range(lo, hi);
                         }
                     }
@@ -10,7 +10,7 @@ mod types;
 pub(crate) mod unicode_tables;
 
 use clap::Parser;
-use std::io::{self, BufRead, Write};
+use std::io::{self, BufRead, Read, Write};
 use std::path::{Path, PathBuf};
 use std::process::ExitCode;
 
@@ -32,6 +32,12 @@ struct Cli {
     #[arg(long = "prelude")]
     prelude: Vec<PathBuf>,
 
+    /// Read FILE's source from standard input instead of from disk. FILE is
+    /// still used as the script's path (module detection, import resolution),
+    /// so a harness can feed generated source without writing a temp file.
+    #[arg(long = "stdin", requires = "file")]
+    stdin: bool,
+
     /// Allow the main agent to block (Atomics.wait)
     #[arg(long = "can-block")]
     can_block: bool,
@@ -133,19 +139,35 @@ fn execute_code(
     exit_code_from_result(&interp, result)
 }
 
+/// Read the main file's source, from stdin instead of `path` if `from_stdin`.
+fn read_main_source(path: &Path, from_stdin: bool) -> Result<String, ExitCode> {
+    if from_stdin {
+        let mut source = String::new();
+        return match io::stdin().read_to_string(&mut source) {
+            Ok(_) => Ok(source),
+            Err(e) => {
+                eprintln!("Error reading stdin: {e}");
+                Err(ExitCode::from(1))
+            }
+        };
+    }
+    std::fs::read_to_string(path).map_err(|e| {
+        eprintln!("Error reading {}: {e}", path.display());
+        ExitCode::from(1)
+    })
+}
+
 fn run_file(
     path: &Path,
+    from_stdin: bool,
     force_module: bool,
     can_block: bool,
     bytecode: bool,
     node: bool,
 ) -> ExitCode {
-    let source = match std::fs::read_to_string(path) {
+    let source = match read_main_source(path, from_stdin) {
         Ok(s) => s,
-        Err(e) => {
-            eprintln!("Error reading {}: {e}", path.display());
-            return ExitCode::from(1);
-        }
+        Err(code) => return code,
     };
     let is_module = force_module || path.extension().is_some_and(|ext| ext == "mjs");
     let abs_path = path.canonicalize().unwrap_or_else(|_| path.to_path_buf());
@@ -248,7 +270,14 @@ fn run_main() -> ExitCode {
         }
 
         if let Some(path) = &cli.file {
-            return run_file(path, cli.module, cli.can_block, cli.bytecode, cli.node);
+            return run_file(
+                path,
+                cli.stdin,
+                cli.module,
+                cli.can_block,
+                cli.bytecode,
+                cli.node,
+            );
         }
 
         let mut interp = new_interp(cli.can_block, cli.bytecode, cli.node);
@@ -291,12 +320,9 @@ fn run_main() -> ExitCode {
         let result = run_source_with_interp(&mut interp, code, cli.module, None);
         exit_code_from_result(&interp, result)
     } else if let Some(path) = &cli.file {
-        let source = match std::fs::read_to_string(path) {
+        let source = match read_main_source(path, cli.stdin) {
             Ok(s) => s,
-            Err(e) => {
-                eprintln!("Error reading {}: {e}", path.display());
-                return ExitCode::from(1);
-            }
+            Err(code) => return code,
         };
         let is_module = cli.module || path.extension().is_some_and(|ext| ext == "mjs");
         let abs_path = path.canonicalize().unwrap_or_else(|_| path.to_path_buf());
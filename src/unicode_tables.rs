@@ -27906,920 +27906,950 @@ pub(crate) fn lookup_property(content: &str) -> Option<&'static [(u32, u32)]> {
     }
 }
 
+/// Look up `name` in a table sorted by name (byte order).
+fn lookup_sorted(
+    table: &'static [(&'static str, &'static [(u32, u32)])],
+    name: &str,
+) -> Option<&'static [(u32, u32)]> {
+    table
+        .binary_search_by(|&(k, _)| k.cmp(name))
+        .ok()
+        .map(|i| table[i].1)
+}
+
+static SCRIPT_BY_NAME: &[(&str, &[(u32, u32)])] = &[
+    ("Adlam", SCRIPT_ADLAM),
+    ("Adlm", SCRIPT_ADLAM),
+    ("Aghb", SCRIPT_CAUCASIAN_ALBANIAN),
+    ("Ahom", SCRIPT_AHOM),
+    ("Anatolian_Hieroglyphs", SCRIPT_ANATOLIAN_HIEROGLYPHS),
+    ("Arab", SCRIPT_ARABIC),
+    ("Arabic", SCRIPT_ARABIC),
+    ("Armenian", SCRIPT_ARMENIAN),
+    ("Armi", SCRIPT_IMPERIAL_ARAMAIC),
+    ("Armn", SCRIPT_ARMENIAN),
+    ("Avestan", SCRIPT_AVESTAN),
+    ("Avst", SCRIPT_AVESTAN),
+    ("Bali", SCRIPT_BALINESE),
+    ("Balinese", SCRIPT_BALINESE),
+    ("Bamu", SCRIPT_BAMUM),
+    ("Bamum", SCRIPT_BAMUM),
+    ("Bass", SCRIPT_BASSA_VAH),
+    ("Bassa_Vah", SCRIPT_BASSA_VAH),
+    ("Batak", SCRIPT_BATAK),
+    ("Batk", SCRIPT_BATAK),
+    ("Beng", SCRIPT_BENGALI),
+    ("Bengali", SCRIPT_BENGALI),
+    ("Berf", SCRIPT_BERIA_ERFE),
+    ("Beria_Erfe", SCRIPT_BERIA_ERFE),
+    ("Bhaiksuki", SCRIPT_BHAIKSUKI),
+    ("Bhks", SCRIPT_BHAIKSUKI),
+    ("Bopo", SCRIPT_BOPOMOFO),
+    ("Bopomofo", SCRIPT_BOPOMOFO),
+    ("Brah", SCRIPT_BRAHMI),
+    ("Brahmi", SCRIPT_BRAHMI),
+    ("Brai", SCRIPT_BRAILLE),
+    ("Braille", SCRIPT_BRAILLE),
+    ("Bugi", SCRIPT_BUGINESE),
+    ("Buginese", SCRIPT_BUGINESE),
+    ("Buhd", SCRIPT_BUHID),
+    ("Buhid", SCRIPT_BUHID),
+    ("Cakm", SCRIPT_CHAKMA),
+    ("Canadian_Aboriginal", SCRIPT_CANADIAN_ABORIGINAL),
+    ("Cans", SCRIPT_CANADIAN_ABORIGINAL),
+    ("Cari", SCRIPT_CARIAN),
+    ("Carian", SCRIPT_CARIAN),
+    ("Caucasian_Albanian", SCRIPT_CAUCASIAN_ALBANIAN),
+    ("Chakma", SCRIPT_CHAKMA),
+    ("Cham", SCRIPT_CHAM),
+    ("Cher", SCRIPT_CHEROKEE),
+    ("Cherokee", SCRIPT_CHEROKEE),
+    ("Chorasmian", SCRIPT_CHORASMIAN),
+    ("Chrs", SCRIPT_CHORASMIAN),
+    ("Common", SCRIPT_COMMON),
+    ("Copt", SCRIPT_COPTIC),
+    ("Coptic", SCRIPT_COPTIC),
+    ("Cpmn", SCRIPT_CYPRO_MINOAN),
+    ("Cprt", SCRIPT_CYPRIOT),
+    ("Cuneiform", SCRIPT_CUNEIFORM),
+    ("Cypriot", SCRIPT_CYPRIOT),
+    ("Cypro_Minoan", SCRIPT_CYPRO_MINOAN),
+    ("Cyrillic", SCRIPT_CYRILLIC),
+    ("Cyrl", SCRIPT_CYRILLIC),
+    ("Deseret", SCRIPT_DESERET),
+    ("Deva", SCRIPT_DEVANAGARI),
+    ("Devanagari", SCRIPT_DEVANAGARI),
+    ("Diak", SCRIPT_DIVES_AKURU),
+    ("Dives_Akuru", SCRIPT_DIVES_AKURU),
+    ("Dogr", SCRIPT_DOGRA),
+    ("Dogra", SCRIPT_DOGRA),
+    ("Dsrt", SCRIPT_DESERET),
+    ("Dupl", SCRIPT_DUPLOYAN),
+    ("Duployan", SCRIPT_DUPLOYAN),
+    ("Egyp", SCRIPT_EGYPTIAN_HIEROGLYPHS),
+    ("Egyptian_Hieroglyphs", SCRIPT_EGYPTIAN_HIEROGLYPHS),
+    ("Elba", SCRIPT_ELBASAN),
+    ("Elbasan", SCRIPT_ELBASAN),
+    ("Elym", SCRIPT_ELYMAIC),
+    ("Elymaic", SCRIPT_ELYMAIC),
+    ("Ethi", SCRIPT_ETHIOPIC),
+    ("Ethiopic", SCRIPT_ETHIOPIC),
+    ("Gara", SCRIPT_GARAY),
+    ("Garay", SCRIPT_GARAY),
+    ("Geor", SCRIPT_GEORGIAN),
+    ("Georgian", SCRIPT_GEORGIAN),
+    ("Glag", SCRIPT_GLAGOLITIC),
+    ("Glagolitic", SCRIPT_GLAGOLITIC),
+    ("Gong", SCRIPT_GUNJALA_GONDI),
+    ("Gonm", SCRIPT_MASARAM_GONDI),
+    ("Goth", SCRIPT_GOTHIC),
+    ("Gothic", SCRIPT_GOTHIC),
+    ("Gran", SCRIPT_GRANTHA),
+    ("Grantha", SCRIPT_GRANTHA),
+    ("Greek", SCRIPT_GREEK),
+    ("Grek", SCRIPT_GREEK),
+    ("Gujarati", SCRIPT_GUJARATI),
+    ("Gujr", SCRIPT_GUJARATI),
+    ("Gukh", SCRIPT_GURUNG_KHEMA),
+    ("Gunjala_Gondi", SCRIPT_GUNJALA_GONDI),
+    ("Gurmukhi", SCRIPT_GURMUKHI),
+    ("Guru", SCRIPT_GURMUKHI),
+    ("Gurung_Khema", SCRIPT_GURUNG_KHEMA),
+    ("Han", SCRIPT_HAN),
+    ("Hang", SCRIPT_HANGUL),
+    ("Hangul", SCRIPT_HANGUL),
+    ("Hani", SCRIPT_HAN),
+    ("Hanifi_Rohingya", SCRIPT_HANIFI_ROHINGYA),
+    ("Hano", SCRIPT_HANUNOO),
+    ("Hanunoo", SCRIPT_HANUNOO),
+    ("Hatr", SCRIPT_HATRAN),
+    ("Hatran", SCRIPT_HATRAN),
+    ("Hebr", SCRIPT_HEBREW),
+    ("Hebrew", SCRIPT_HEBREW),
+    ("Hira", SCRIPT_HIRAGANA),
+    ("Hiragana", SCRIPT_HIRAGANA),
+    ("Hluw", SCRIPT_ANATOLIAN_HIEROGLYPHS),
+    ("Hmng", SCRIPT_PAHAWH_HMONG),
+    ("Hmnp", SCRIPT_NYIAKENG_PUACHUE_HMONG),
+    ("Hung", SCRIPT_OLD_HUNGARIAN),
+    ("Imperial_Aramaic", SCRIPT_IMPERIAL_ARAMAIC),
+    ("Inherited", SCRIPT_INHERITED),
+    ("Inscriptional_Pahlavi", SCRIPT_INSCRIPTIONAL_PAHLAVI),
+    ("Inscriptional_Parthian", SCRIPT_INSCRIPTIONAL_PARTHIAN),
+    ("Ital", SCRIPT_OLD_ITALIC),
+    ("Java", SCRIPT_JAVANESE),
+    ("Javanese", SCRIPT_JAVANESE),
+    ("Kaithi", SCRIPT_KAITHI),
+    ("Kali", SCRIPT_KAYAH_LI),
+    ("Kana", SCRIPT_KATAKANA),
+    ("Kannada", SCRIPT_KANNADA),
+    ("Katakana", SCRIPT_KATAKANA),
+    ("Kawi", SCRIPT_KAWI),
+    ("Kayah_Li", SCRIPT_KAYAH_LI),
+    ("Khar", SCRIPT_KHAROSHTHI),
+    ("Kharoshthi", SCRIPT_KHAROSHTHI),
+    ("Khitan_Small_Script", SCRIPT_KHITAN_SMALL_SCRIPT),
+    ("Khmer", SCRIPT_KHMER),
+    ("Khmr", SCRIPT_KHMER),
+    ("Khoj", SCRIPT_KHOJKI),
+    ("Khojki", SCRIPT_KHOJKI),
+    ("Khudawadi", SCRIPT_KHUDAWADI),
+    ("Kirat_Rai", SCRIPT_KIRAT_RAI),
+    ("Kits", SCRIPT_KHITAN_SMALL_SCRIPT),
+    ("Knda", SCRIPT_KANNADA),
+    ("Krai", SCRIPT_KIRAT_RAI),
+    ("Kthi", SCRIPT_KAITHI),
+    ("Lana", SCRIPT_TAI_THAM),
+    ("Lao", SCRIPT_LAO),
+    ("Laoo", SCRIPT_LAO),
+    ("Latin", SCRIPT_LATIN),
+    ("Latn", SCRIPT_LATIN),
+    ("Lepc", SCRIPT_LEPCHA),
+    ("Lepcha", SCRIPT_LEPCHA),
+    ("Limb", SCRIPT_LIMBU),
+    ("Limbu", SCRIPT_LIMBU),
+    ("Lina", SCRIPT_LINEAR_A),
+    ("Linb", SCRIPT_LINEAR_B),
+    ("Linear_A", SCRIPT_LINEAR_A),
+    ("Linear_B", SCRIPT_LINEAR_B),
+    ("Lisu", SCRIPT_LISU),
+    ("Lyci", SCRIPT_LYCIAN),
+    ("Lycian", SCRIPT_LYCIAN),
+    ("Lydi", SCRIPT_LYDIAN),
+    ("Lydian", SCRIPT_LYDIAN),
+    ("Mahajani", SCRIPT_MAHAJANI),
+    ("Mahj", SCRIPT_MAHAJANI),
+    ("Maka", SCRIPT_MAKASAR),
+    ("Makasar", SCRIPT_MAKASAR),
+    ("Malayalam", SCRIPT_MALAYALAM),
+    ("Mand", SCRIPT_MANDAIC),
+    ("Mandaic", SCRIPT_MANDAIC),
+    ("Mani", SCRIPT_MANICHAEAN),
+    ("Manichaean", SCRIPT_MANICHAEAN),
+    ("Marc", SCRIPT_MARCHEN),
+    ("Marchen", SCRIPT_MARCHEN),
+    ("Masaram_Gondi", SCRIPT_MASARAM_GONDI),
+    ("Medefaidrin", SCRIPT_MEDEFAIDRIN),
+    ("Medf", SCRIPT_MEDEFAIDRIN),
+    ("Meetei_Mayek", SCRIPT_MEETEI_MAYEK),
+    ("Mend", SCRIPT_MENDE_KIKAKUI),
+    ("Mende_Kikakui", SCRIPT_MENDE_KIKAKUI),
+    ("Merc", SCRIPT_MEROITIC_CURSIVE),
+    ("Mero", SCRIPT_MEROITIC_HIEROGLYPHS),
+    ("Meroitic_Cursive", SCRIPT_MEROITIC_CURSIVE),
+    ("Meroitic_Hieroglyphs", SCRIPT_MEROITIC_HIEROGLYPHS),
+    ("Miao", SCRIPT_MIAO),
+    ("Mlym", SCRIPT_MALAYALAM),
+    ("Modi", SCRIPT_MODI),
+    ("Mong", SCRIPT_MONGOLIAN),
+    ("Mongolian", SCRIPT_MONGOLIAN),
+    ("Mro", SCRIPT_MRO),
+    ("Mroo", SCRIPT_MRO),
+    ("Mtei", SCRIPT_MEETEI_MAYEK),
+    ("Mult", SCRIPT_MULTANI),
+    ("Multani", SCRIPT_MULTANI),
+    ("Myanmar", SCRIPT_MYANMAR),
+    ("Mymr", SCRIPT_MYANMAR),
+    ("Nabataean", SCRIPT_NABATAEAN),
+    ("Nag_Mundari", SCRIPT_NAG_MUNDARI),
+    ("Nagm", SCRIPT_NAG_MUNDARI),
+    ("Nand", SCRIPT_NANDINAGARI),
+    ("Nandinagari", SCRIPT_NANDINAGARI),
+    ("Narb", SCRIPT_OLD_NORTH_ARABIAN),
+    ("Nbat", SCRIPT_NABATAEAN),
+    ("New_Tai_Lue", SCRIPT_NEW_TAI_LUE),
+    ("Newa", SCRIPT_NEWA),
+    ("Nko", SCRIPT_NKO),
+    ("Nkoo", SCRIPT_NKO),
+    ("Nshu", SCRIPT_NUSHU),
+    ("Nushu", SCRIPT_NUSHU),
+    ("Nyiakeng_Puachue_Hmong", SCRIPT_NYIAKENG_PUACHUE_HMONG),
+    ("Ogam", SCRIPT_OGHAM),
+    ("Ogham", SCRIPT_OGHAM),
+    ("Ol_Chiki", SCRIPT_OL_CHIKI),
+    ("Ol_Onal", SCRIPT_OL_ONAL),
+    ("Olck", SCRIPT_OL_CHIKI),
+    ("Old_Hungarian", SCRIPT_OLD_HUNGARIAN),
+    ("Old_Italic", SCRIPT_OLD_ITALIC),
+    ("Old_North_Arabian", SCRIPT_OLD_NORTH_ARABIAN),
+    ("Old_Permic", SCRIPT_OLD_PERMIC),
+    ("Old_Persian", SCRIPT_OLD_PERSIAN),
+    ("Old_Sogdian", SCRIPT_OLD_SOGDIAN),
+    ("Old_South_Arabian", SCRIPT_OLD_SOUTH_ARABIAN),
+    ("Old_Turkic", SCRIPT_OLD_TURKIC),
+    ("Old_Uyghur", SCRIPT_OLD_UYGHUR),
+    ("Onao", SCRIPT_OL_ONAL),
+    ("Oriya", SCRIPT_ORIYA),
+    ("Orkh", SCRIPT_OLD_TURKIC),
+    ("Orya", SCRIPT_ORIYA),
+    ("Osage", SCRIPT_OSAGE),
+    ("Osge", SCRIPT_OSAGE),
+    ("Osma", SCRIPT_OSMANYA),
+    ("Osmanya", SCRIPT_OSMANYA),
+    ("Ougr", SCRIPT_OLD_UYGHUR),
+    ("Pahawh_Hmong", SCRIPT_PAHAWH_HMONG),
+    ("Palm", SCRIPT_PALMYRENE),
+    ("Palmyrene", SCRIPT_PALMYRENE),
+    ("Pau_Cin_Hau", SCRIPT_PAU_CIN_HAU),
+    ("Pauc", SCRIPT_PAU_CIN_HAU),
+    ("Perm", SCRIPT_OLD_PERMIC),
+    ("Phag", SCRIPT_PHAGS_PA),
+    ("Phags_Pa", SCRIPT_PHAGS_PA),
+    ("Phli", SCRIPT_INSCRIPTIONAL_PAHLAVI),
+    ("Phlp", SCRIPT_PSALTER_PAHLAVI),
+    ("Phnx", SCRIPT_PHOENICIAN),
+    ("Phoenician", SCRIPT_PHOENICIAN),
+    ("Plrd", SCRIPT_MIAO),
+    ("Prti", SCRIPT_INSCRIPTIONAL_PARTHIAN),
+    ("Psalter_Pahlavi", SCRIPT_PSALTER_PAHLAVI),
+    ("Qaac", SCRIPT_COPTIC),
+    ("Qaai", SCRIPT_INHERITED),
+    ("Rejang", SCRIPT_REJANG),
+    ("Rjng", SCRIPT_REJANG),
+    ("Rohg", SCRIPT_HANIFI_ROHINGYA),
+    ("Runic", SCRIPT_RUNIC),
+    ("Runr", SCRIPT_RUNIC),
+    ("Samaritan", SCRIPT_SAMARITAN),
+    ("Samr", SCRIPT_SAMARITAN),
+    ("Sarb", SCRIPT_OLD_SOUTH_ARABIAN),
+    ("Saur", SCRIPT_SAURASHTRA),
+    ("Saurashtra", SCRIPT_SAURASHTRA),
+    ("Sgnw", SCRIPT_SIGNWRITING),
+    ("Sharada", SCRIPT_SHARADA),
+    ("Shavian", SCRIPT_SHAVIAN),
+    ("Shaw", SCRIPT_SHAVIAN),
+    ("Shrd", SCRIPT_SHARADA),
+    ("Sidd", SCRIPT_SIDDHAM),
+    ("Siddham", SCRIPT_SIDDHAM),
+    ("Sidetic", SCRIPT_SIDETIC),
+    ("Sidt", SCRIPT_SIDETIC),
+    ("SignWriting", SCRIPT_SIGNWRITING),
+    ("Sind", SCRIPT_KHUDAWADI),
+    ("Sinh", SCRIPT_SINHALA),
+    ("Sinhala", SCRIPT_SINHALA),
+    ("Sogd", SCRIPT_SOGDIAN),
+    ("Sogdian", SCRIPT_SOGDIAN),
+    ("Sogo", SCRIPT_OLD_SOGDIAN),
+    ("Sora", SCRIPT_SORA_SOMPENG),
+    ("Sora_Sompeng", SCRIPT_SORA_SOMPENG),
+    ("Soyo", SCRIPT_SOYOMBO),
+    ("Soyombo", SCRIPT_SOYOMBO),
+    ("Sund", SCRIPT_SUNDANESE),
+    ("Sundanese", SCRIPT_SUNDANESE),
+    ("Sunu", SCRIPT_SUNUWAR),
+    ("Sunuwar", SCRIPT_SUNUWAR),
+    ("Sylo", SCRIPT_SYLOTI_NAGRI),
+    ("Syloti_Nagri", SCRIPT_SYLOTI_NAGRI),
+    ("Syrc", SCRIPT_SYRIAC),
+    ("Syriac", SCRIPT_SYRIAC),
+    ("Tagalog", SCRIPT_TAGALOG),
+    ("Tagb", SCRIPT_TAGBANWA),
+    ("Tagbanwa", SCRIPT_TAGBANWA),
+    ("Tai_Le", SCRIPT_TAI_LE),
+    ("Tai_Tham", SCRIPT_TAI_THAM),
+    ("Tai_Viet", SCRIPT_TAI_VIET),
+    ("Tai_Yo", SCRIPT_TAI_YO),
+    ("Takr", SCRIPT_TAKRI),
+    ("Takri", SCRIPT_TAKRI),
+    ("Tale", SCRIPT_TAI_LE),
+    ("Talu", SCRIPT_NEW_TAI_LUE),
+    ("Tamil", SCRIPT_TAMIL),
+    ("Taml", SCRIPT_TAMIL),
+    ("Tang", SCRIPT_TANGUT),
+    ("Tangsa", SCRIPT_TANGSA),
+    ("Tangut", SCRIPT_TANGUT),
+    ("Tavt", SCRIPT_TAI_VIET),
+    ("Tayo", SCRIPT_TAI_YO),
+    ("Telu", SCRIPT_TELUGU),
+    ("Telugu", SCRIPT_TELUGU),
+    ("Tfng", SCRIPT_TIFINAGH),
+    ("Tglg", SCRIPT_TAGALOG),
+    ("Thaa", SCRIPT_THAANA),
+    ("Thaana", SCRIPT_THAANA),
+    ("Thai", SCRIPT_THAI),
+    ("Tibetan", SCRIPT_TIBETAN),
+    ("Tibt", SCRIPT_TIBETAN),
+    ("Tifinagh", SCRIPT_TIFINAGH),
+    ("Tirh", SCRIPT_TIRHUTA),
+    ("Tirhuta", SCRIPT_TIRHUTA),
+    ("Tnsa", SCRIPT_TANGSA),
+    ("Todhri", SCRIPT_TODHRI),
+    ("Todr", SCRIPT_TODHRI),
+    ("Tolong_Siki", SCRIPT_TOLONG_SIKI),
+    ("Tols", SCRIPT_TOLONG_SIKI),
+    ("Toto", SCRIPT_TOTO),
+    ("Tulu_Tigalari", SCRIPT_TULU_TIGALARI),
+    ("Tutg", SCRIPT_TULU_TIGALARI),
+    ("Ugar", SCRIPT_UGARITIC),
+    ("Ugaritic", SCRIPT_UGARITIC),
+    ("Unknown", SCRIPT_UNKNOWN),
+    ("Vai", SCRIPT_VAI),
+    ("Vaii", SCRIPT_VAI),
+    ("Vith", SCRIPT_VITHKUQI),
+    ("Vithkuqi", SCRIPT_VITHKUQI),
+    ("Wancho", SCRIPT_WANCHO),
+    ("Wara", SCRIPT_WARANG_CITI),
+    ("Warang_Citi", SCRIPT_WARANG_CITI),
+    ("Wcho", SCRIPT_WANCHO),
+    ("Xpeo", SCRIPT_OLD_PERSIAN),
+    ("Xsux", SCRIPT_CUNEIFORM),
+    ("Yezi", SCRIPT_YEZIDI),
+    ("Yezidi", SCRIPT_YEZIDI),
+    ("Yi", SCRIPT_YI),
+    ("Yiii", SCRIPT_YI),
+    ("Zanabazar_Square", SCRIPT_ZANABAZAR_SQUARE),
+    ("Zanb", SCRIPT_ZANABAZAR_SQUARE),
+    ("Zinh", SCRIPT_INHERITED),
+    ("Zyyy", SCRIPT_COMMON),
+    ("Zzzz", SCRIPT_UNKNOWN),
+];
+
 fn lookup_script(value: &str) -> Option<&'static [(u32, u32)]> {
-    match value {
-        "Adlam" => Some(SCRIPT_ADLAM),
-        "Adlm" => Some(SCRIPT_ADLAM),
-        "Ahom" => Some(SCRIPT_AHOM),
-        "Anatolian_Hieroglyphs" => Some(SCRIPT_ANATOLIAN_HIEROGLYPHS),
-        "Hluw" => Some(SCRIPT_ANATOLIAN_HIEROGLYPHS),
-        "Arab" => Some(SCRIPT_ARABIC),
-        "Arabic" => Some(SCRIPT_ARABIC),
-        "Armenian" => Some(SCRIPT_ARMENIAN),
-        "Armn" => Some(SCRIPT_ARMENIAN),
-        "Avestan" => Some(SCRIPT_AVESTAN),
-        "Avst" => Some(SCRIPT_AVESTAN),
-        "Bali" => Some(SCRIPT_BALINESE),
-        "Balinese" => Some(SCRIPT_BALINESE),
-        "Bamu" => Some(SCRIPT_BAMUM),
-        "Bamum" => Some(SCRIPT_BAMUM),
-        "Bass" => Some(SCRIPT_BASSA_VAH),
-        "Bassa_Vah" => Some(SCRIPT_BASSA_VAH),
-        "Batak" => Some(SCRIPT_BATAK),
-        "Batk" => Some(SCRIPT_BATAK),
-        "Beng" => Some(SCRIPT_BENGALI),
-        "Bengali" => Some(SCRIPT_BENGALI),
-        "Berf" => Some(SCRIPT_BERIA_ERFE),
-        "Beria_Erfe" => Some(SCRIPT_BERIA_ERFE),
-        "Bhaiksuki" => Some(SCRIPT_BHAIKSUKI),
-        "Bhks" => Some(SCRIPT_BHAIKSUKI),
-        "Bopo" => Some(SCRIPT_BOPOMOFO),
-        "Bopomofo" => Some(SCRIPT_BOPOMOFO),
-        "Brah" => Some(SCRIPT_BRAHMI),
-        "Brahmi" => Some(SCRIPT_BRAHMI),
-        "Brai" => Some(SCRIPT_BRAILLE),
-        "Braille" => Some(SCRIPT_BRAILLE),
-        "Bugi" => Some(SCRIPT_BUGINESE),
-        "Buginese" => Some(SCRIPT_BUGINESE),
-        "Buhd" => Some(SCRIPT_BUHID),
-        "Buhid" => Some(SCRIPT_BUHID),
-        "Canadian_Aboriginal" => Some(SCRIPT_CANADIAN_ABORIGINAL),
-        "Cans" => Some(SCRIPT_CANADIAN_ABORIGINAL),
-        "Cari" => Some(SCRIPT_CARIAN),
-        "Carian" => Some(SCRIPT_CARIAN),
-        "Aghb" => Some(SCRIPT_CAUCASIAN_ALBANIAN),
-        "Caucasian_Albanian" => Some(SCRIPT_CAUCASIAN_ALBANIAN),
-        "Cakm" => Some(SCRIPT_CHAKMA),
-        "Chakma" => Some(SCRIPT_CHAKMA),
-        "Cham" => Some(SCRIPT_CHAM),
-        "Cher" => Some(SCRIPT_CHEROKEE),
-        "Cherokee" => Some(SCRIPT_CHEROKEE),
-        "Chorasmian" => Some(SCRIPT_CHORASMIAN),
-        "Chrs" => Some(SCRIPT_CHORASMIAN),
-        "Common" => Some(SCRIPT_COMMON),
-        "Zyyy" => Some(SCRIPT_COMMON),
-        "Copt" => Some(SCRIPT_COPTIC),
-        "Coptic" => Some(SCRIPT_COPTIC),
-        "Qaac" => Some(SCRIPT_COPTIC),
-        "Cuneiform" => Some(SCRIPT_CUNEIFORM),
-        "Xsux" => Some(SCRIPT_CUNEIFORM),
-        "Cprt" => Some(SCRIPT_CYPRIOT),
-        "Cypriot" => Some(SCRIPT_CYPRIOT),
-        "Cpmn" => Some(SCRIPT_CYPRO_MINOAN),
-        "Cypro_Minoan" => Some(SCRIPT_CYPRO_MINOAN),
-        "Cyrillic" => Some(SCRIPT_CYRILLIC),
-        "Cyrl" => Some(SCRIPT_CYRILLIC),
-        "Deseret" => Some(SCRIPT_DESERET),
-        "Dsrt" => Some(SCRIPT_DESERET),
-        "Deva" => Some(SCRIPT_DEVANAGARI),
-        "Devanagari" => Some(SCRIPT_DEVANAGARI),
-        "Diak" => Some(SCRIPT_DIVES_AKURU),
-        "Dives_Akuru" => Some(SCRIPT_DIVES_AKURU),
-        "Dogr" => Some(SCRIPT_DOGRA),
-        "Dogra" => Some(SCRIPT_DOGRA),
-        "Dupl" => Some(SCRIPT_DUPLOYAN),
-        "Duployan" => Some(SCRIPT_DUPLOYAN),
-        "Egyp" => Some(SCRIPT_EGYPTIAN_HIEROGLYPHS),
-        "Egyptian_Hieroglyphs" => Some(SCRIPT_EGYPTIAN_HIEROGLYPHS),
-        "Elba" => Some(SCRIPT_ELBASAN),
-        "Elbasan" => Some(SCRIPT_ELBASAN),
-        "Elym" => Some(SCRIPT_ELYMAIC),
-        "Elymaic" => Some(SCRIPT_ELYMAIC),
-        "Ethi" => Some(SCRIPT_ETHIOPIC),
-        "Ethiopic" => Some(SCRIPT_ETHIOPIC),
-        "Gara" => Some(SCRIPT_GARAY),
-        "Garay" => Some(SCRIPT_GARAY),
-        "Geor" => Some(SCRIPT_GEORGIAN),
-        "Georgian" => Some(SCRIPT_GEORGIAN),
-        "Glag" => Some(SCRIPT_GLAGOLITIC),
-        "Glagolitic" => Some(SCRIPT_GLAGOLITIC),
-        "Goth" => Some(SCRIPT_GOTHIC),
-        "Gothic" => Some(SCRIPT_GOTHIC),
-        "Gran" => Some(SCRIPT_GRANTHA),
-        "Grantha" => Some(SCRIPT_GRANTHA),
-        "Greek" => Some(SCRIPT_GREEK),
-        "Grek" => Some(SCRIPT_GREEK),
-        "Gujarati" => Some(SCRIPT_GUJARATI),
-        "Gujr" => Some(SCRIPT_GUJARATI),
-        "Gong" => Some(SCRIPT_GUNJALA_GONDI),
-        "Gunjala_Gondi" => Some(SCRIPT_GUNJALA_GONDI),
-        "Gurmukhi" => Some(SCRIPT_GURMUKHI),
-        "Guru" => Some(SCRIPT_GURMUKHI),
-        "Gukh" => Some(SCRIPT_GURUNG_KHEMA),
-        "Gurung_Khema" => Some(SCRIPT_GURUNG_KHEMA),
-        "Han" => Some(SCRIPT_HAN),
-        "Hani" => Some(SCRIPT_HAN),
-        "Hang" => Some(SCRIPT_HANGUL),
-        "Hangul" => Some(SCRIPT_HANGUL),
-        "Hanifi_Rohingya" => Some(SCRIPT_HANIFI_ROHINGYA),
-        "Rohg" => Some(SCRIPT_HANIFI_ROHINGYA),
-        "Hano" => Some(SCRIPT_HANUNOO),
-        "Hanunoo" => Some(SCRIPT_HANUNOO),
-        "Hatr" => Some(SCRIPT_HATRAN),
-        "Hatran" => Some(SCRIPT_HATRAN),
-        "Hebr" => Some(SCRIPT_HEBREW),
-        "Hebrew" => Some(SCRIPT_HEBREW),
-        "Hira" => Some(SCRIPT_HIRAGANA),
-        "Hiragana" => Some(SCRIPT_HIRAGANA),
-        "Armi" => Some(SCRIPT_IMPERIAL_ARAMAIC),
-        "Imperial_Aramaic" => Some(SCRIPT_IMPERIAL_ARAMAIC),
-        "Inherited" => Some(SCRIPT_INHERITED),
-        "Qaai" => Some(SCRIPT_INHERITED),
-        "Zinh" => Some(SCRIPT_INHERITED),
-        "Inscriptional_Pahlavi" => Some(SCRIPT_INSCRIPTIONAL_PAHLAVI),
-        "Phli" => Some(SCRIPT_INSCRIPTIONAL_PAHLAVI),
-        "Inscriptional_Parthian" => Some(SCRIPT_INSCRIPTIONAL_PARTHIAN),
-        "Prti" => Some(SCRIPT_INSCRIPTIONAL_PARTHIAN),
-        "Java" => Some(SCRIPT_JAVANESE),
-        "Javanese" => Some(SCRIPT_JAVANESE),
-        "Kaithi" => Some(SCRIPT_KAITHI),
-        "Kthi" => Some(SCRIPT_KAITHI),
-        "Kannada" => Some(SCRIPT_KANNADA),
-        "Knda" => Some(SCRIPT_KANNADA),
-        "Kana" => Some(SCRIPT_KATAKANA),
-        "Katakana" => Some(SCRIPT_KATAKANA),
-        "Kawi" => Some(SCRIPT_KAWI),
-        "Kali" => Some(SCRIPT_KAYAH_LI),
-        "Kayah_Li" => Some(SCRIPT_KAYAH_LI),
-        "Khar" => Some(SCRIPT_KHAROSHTHI),
-        "Kharoshthi" => Some(SCRIPT_KHAROSHTHI),
-        "Khitan_Small_Script" => Some(SCRIPT_KHITAN_SMALL_SCRIPT),
-        "Kits" => Some(SCRIPT_KHITAN_SMALL_SCRIPT),
-        "Khmer" => Some(SCRIPT_KHMER),
-        "Khmr" => Some(SCRIPT_KHMER),
-        "Khoj" => Some(SCRIPT_KHOJKI),
-        "Khojki" => Some(SCRIPT_KHOJKI),
-        "Khudawadi" => Some(SCRIPT_KHUDAWADI),
-        "Sind" => Some(SCRIPT_KHUDAWADI),
-        "Kirat_Rai" => Some(SCRIPT_KIRAT_RAI),
-        "Krai" => Some(SCRIPT_KIRAT_RAI),
-        "Lao" => Some(SCRIPT_LAO),
-        "Laoo" => Some(SCRIPT_LAO),
-        "Latin" => Some(SCRIPT_LATIN),
-        "Latn" => Some(SCRIPT_LATIN),
-        "Lepc" => Some(SCRIPT_LEPCHA),
-        "Lepcha" => Some(SCRIPT_LEPCHA),
-        "Limb" => Some(SCRIPT_LIMBU),
-        "Limbu" => Some(SCRIPT_LIMBU),
-        "Lina" => Some(SCRIPT_LINEAR_A),
-        "Linear_A" => Some(SCRIPT_LINEAR_A),
-        "Linb" => Some(SCRIPT_LINEAR_B),
-        "Linear_B" => Some(SCRIPT_LINEAR_B),
-        "Lisu" => Some(SCRIPT_LISU),
-        "Lyci" => Some(SCRIPT_LYCIAN),
-        "Lycian" => Some(SCRIPT_LYCIAN),
-        "Lydi" => Some(SCRIPT_LYDIAN),
-        "Lydian" => Some(SCRIPT_LYDIAN),
-        "Mahajani" => Some(SCRIPT_MAHAJANI),
-        "Mahj" => Some(SCRIPT_MAHAJANI),
-        "Maka" => Some(SCRIPT_MAKASAR),
-        "Makasar" => Some(SCRIPT_MAKASAR),
-        "Malayalam" => Some(SCRIPT_MALAYALAM),
-        "Mlym" => Some(SCRIPT_MALAYALAM),
-        "Mand" => Some(SCRIPT_MANDAIC),
-        "Mandaic" => Some(SCRIPT_MANDAIC),
-        "Mani" => Some(SCRIPT_MANICHAEAN),
-        "Manichaean" => Some(SCRIPT_MANICHAEAN),
-        "Marc" => Some(SCRIPT_MARCHEN),
-        "Marchen" => Some(SCRIPT_MARCHEN),
-        "Gonm" => Some(SCRIPT_MASARAM_GONDI),
-        "Masaram_Gondi" => Some(SCRIPT_MASARAM_GONDI),
-        "Medefaidrin" => Some(SCRIPT_MEDEFAIDRIN),
-        "Medf" => Some(SCRIPT_MEDEFAIDRIN),
-        "Meetei_Mayek" => Some(SCRIPT_MEETEI_MAYEK),
-        "Mtei" => Some(SCRIPT_MEETEI_MAYEK),
-        "Mend" => Some(SCRIPT_MENDE_KIKAKUI),
-        "Mende_Kikakui" => Some(SCRIPT_MENDE_KIKAKUI),
-        "Merc" => Some(SCRIPT_MEROITIC_CURSIVE),
-        "Meroitic_Cursive" => Some(SCRIPT_MEROITIC_CURSIVE),
-        "Mero" => Some(SCRIPT_MEROITIC_HIEROGLYPHS),
-        "Meroitic_Hieroglyphs" => Some(SCRIPT_MEROITIC_HIEROGLYPHS),
-        "Miao" => Some(SCRIPT_MIAO),
-        "Plrd" => Some(SCRIPT_MIAO),
-        "Modi" => Some(SCRIPT_MODI),
-        "Mong" => Some(SCRIPT_MONGOLIAN),
-        "Mongolian" => Some(SCRIPT_MONGOLIAN),
-        "Mro" => Some(SCRIPT_MRO),
-        "Mroo" => Some(SCRIPT_MRO),
-        "Mult" => Some(SCRIPT_MULTANI),
-        "Multani" => Some(SCRIPT_MULTANI),
-        "Myanmar" => Some(SCRIPT_MYANMAR),
-        "Mymr" => Some(SCRIPT_MYANMAR),
-        "Nabataean" => Some(SCRIPT_NABATAEAN),
-        "Nbat" => Some(SCRIPT_NABATAEAN),
-        "Nag_Mundari" => Some(SCRIPT_NAG_MUNDARI),
-        "Nagm" => Some(SCRIPT_NAG_MUNDARI),
-        "Nand" => Some(SCRIPT_NANDINAGARI),
-        "Nandinagari" => Some(SCRIPT_NANDINAGARI),
-        "New_Tai_Lue" => Some(SCRIPT_NEW_TAI_LUE),
-        "Talu" => Some(SCRIPT_NEW_TAI_LUE),
-        "Newa" => Some(SCRIPT_NEWA),
-        "Nko" => Some(SCRIPT_NKO),
-        "Nkoo" => Some(SCRIPT_NKO),
-        "Nshu" => Some(SCRIPT_NUSHU),
-        "Nushu" => Some(SCRIPT_NUSHU),
-        "Hmnp" => Some(SCRIPT_NYIAKENG_PUACHUE_HMONG),
-        "Nyiakeng_Puachue_Hmong" => Some(SCRIPT_NYIAKENG_PUACHUE_HMONG),
-        "Ogam" => Some(SCRIPT_OGHAM),
-        "Ogham" => Some(SCRIPT_OGHAM),
-        "Ol_Chiki" => Some(SCRIPT_OL_CHIKI),
-        "Olck" => Some(SCRIPT_OL_CHIKI),
-        "Ol_Onal" => Some(SCRIPT_OL_ONAL),
-        "Onao" => Some(SCRIPT_OL_ONAL),
-        "Hung" => Some(SCRIPT_OLD_HUNGARIAN),
-        "Old_Hungarian" => Some(SCRIPT_OLD_HUNGARIAN),
-        "Ital" => Some(SCRIPT_OLD_ITALIC),
-        "Old_Italic" => Some(SCRIPT_OLD_ITALIC),
-        "Narb" => Some(SCRIPT_OLD_NORTH_ARABIAN),
-        "Old_North_Arabian" => Some(SCRIPT_OLD_NORTH_ARABIAN),
-        "Old_Permic" => Some(SCRIPT_OLD_PERMIC),
-        "Perm" => Some(SCRIPT_OLD_PERMIC),
-        "Old_Persian" => Some(SCRIPT_OLD_PERSIAN),
-        "Xpeo" => Some(SCRIPT_OLD_PERSIAN),
-        "Old_Sogdian" => Some(SCRIPT_OLD_SOGDIAN),
-        "Sogo" => Some(SCRIPT_OLD_SOGDIAN),
-        "Old_South_Arabian" => Some(SCRIPT_OLD_SOUTH_ARABIAN),
-        "Sarb" => Some(SCRIPT_OLD_SOUTH_ARABIAN),
-        "Old_Turkic" => Some(SCRIPT_OLD_TURKIC),
-        "Orkh" => Some(SCRIPT_OLD_TURKIC),
-        "Old_Uyghur" => Some(SCRIPT_OLD_UYGHUR),
-        "Ougr" => Some(SCRIPT_OLD_UYGHUR),
-        "Oriya" => Some(SCRIPT_ORIYA),
-        "Orya" => Some(SCRIPT_ORIYA),
-        "Osage" => Some(SCRIPT_OSAGE),
-        "Osge" => Some(SCRIPT_OSAGE),
-        "Osma" => Some(SCRIPT_OSMANYA),
-        "Osmanya" => Some(SCRIPT_OSMANYA),
-        "Hmng" => Some(SCRIPT_PAHAWH_HMONG),
-        "Pahawh_Hmong" => Some(SCRIPT_PAHAWH_HMONG),
-        "Palm" => Some(SCRIPT_PALMYRENE),
-        "Palmyrene" => Some(SCRIPT_PALMYRENE),
-        "Pau_Cin_Hau" => Some(SCRIPT_PAU_CIN_HAU),
-        "Pauc" => Some(SCRIPT_PAU_CIN_HAU),
-        "Phag" => Some(SCRIPT_PHAGS_PA),
-        "Phags_Pa" => Some(SCRIPT_PHAGS_PA),
-        "Phnx" => Some(SCRIPT_PHOENICIAN),
-        "Phoenician" => Some(SCRIPT_PHOENICIAN),
-        "Phlp" => Some(SCRIPT_PSALTER_PAHLAVI),
-        "Psalter_Pahlavi" => Some(SCRIPT_PSALTER_PAHLAVI),
-        "Rejang" => Some(SCRIPT_REJANG),
-        "Rjng" => Some(SCRIPT_REJANG),
-        "Runic" => Some(SCRIPT_RUNIC),
-        "Runr" => Some(SCRIPT_RUNIC),
-        "Samaritan" => Some(SCRIPT_SAMARITAN),
-        "Samr" => Some(SCRIPT_SAMARITAN),
-        "Saur" => Some(SCRIPT_SAURASHTRA),
-        "Saurashtra" => Some(SCRIPT_SAURASHTRA),
-        "Sharada" => Some(SCRIPT_SHARADA),
-        "Shrd" => Some(SCRIPT_SHARADA),
-        "Shavian" => Some(SCRIPT_SHAVIAN),
-        "Shaw" => Some(SCRIPT_SHAVIAN),
-        "Sidd" => Some(SCRIPT_SIDDHAM),
-        "Siddham" => Some(SCRIPT_SIDDHAM),
-        "Sidetic" => Some(SCRIPT_SIDETIC),
-        "Sidt" => Some(SCRIPT_SIDETIC),
-        "Sgnw" => Some(SCRIPT_SIGNWRITING),
-        "SignWriting" => Some(SCRIPT_SIGNWRITING),
-        "Sinh" => Some(SCRIPT_SINHALA),
-        "Sinhala" => Some(SCRIPT_SINHALA),
-        "Sogd" => Some(SCRIPT_SOGDIAN),
-        "Sogdian" => Some(SCRIPT_SOGDIAN),
-        "Sora" => Some(SCRIPT_SORA_SOMPENG),
-        "Sora_Sompeng" => Some(SCRIPT_SORA_SOMPENG),
-        "Soyo" => Some(SCRIPT_SOYOMBO),
-        "Soyombo" => Some(SCRIPT_SOYOMBO),
-        "Sund" => Some(SCRIPT_SUNDANESE),
-        "Sundanese" => Some(SCRIPT_SUNDANESE),
-        "Sunu" => Some(SCRIPT_SUNUWAR),
-        "Sunuwar" => Some(SCRIPT_SUNUWAR),
-        "Sylo" => Some(SCRIPT_SYLOTI_NAGRI),
-        "Syloti_Nagri" => Some(SCRIPT_SYLOTI_NAGRI),
-        "Syrc" => Some(SCRIPT_SYRIAC),
-        "Syriac" => Some(SCRIPT_SYRIAC),
-        "Tagalog" => Some(SCRIPT_TAGALOG),
-        "Tglg" => Some(SCRIPT_TAGALOG),
-        "Tagb" => Some(SCRIPT_TAGBANWA),
-        "Tagbanwa" => Some(SCRIPT_TAGBANWA),
-        "Tai_Le" => Some(SCRIPT_TAI_LE),
-        "Tale" => Some(SCRIPT_TAI_LE),
-        "Lana" => Some(SCRIPT_TAI_THAM),
-        "Tai_Tham" => Some(SCRIPT_TAI_THAM),
-        "Tai_Viet" => Some(SCRIPT_TAI_VIET),
-        "Tavt" => Some(SCRIPT_TAI_VIET),
-        "Tai_Yo" => Some(SCRIPT_TAI_YO),
-        "Tayo" => Some(SCRIPT_TAI_YO),
-        "Takr" => Some(SCRIPT_TAKRI),
-        "Takri" => Some(SCRIPT_TAKRI),
-        "Tamil" => Some(SCRIPT_TAMIL),
-        "Taml" => Some(SCRIPT_TAMIL),
-        "Tangsa" => Some(SCRIPT_TANGSA),
-        "Tnsa" => Some(SCRIPT_TANGSA),
-        "Tang" => Some(SCRIPT_TANGUT),
-        "Tangut" => Some(SCRIPT_TANGUT),
-        "Telu" => Some(SCRIPT_TELUGU),
-        "Telugu" => Some(SCRIPT_TELUGU),
-        "Thaa" => Some(SCRIPT_THAANA),
-        "Thaana" => Some(SCRIPT_THAANA),
-        "Thai" => Some(SCRIPT_THAI),
-        "Tibetan" => Some(SCRIPT_TIBETAN),
-        "Tibt" => Some(SCRIPT_TIBETAN),
-        "Tfng" => Some(SCRIPT_TIFINAGH),
-        "Tifinagh" => Some(SCRIPT_TIFINAGH),
-        "Tirh" => Some(SCRIPT_TIRHUTA),
-        "Tirhuta" => Some(SCRIPT_TIRHUTA),
-        "Todhri" => Some(SCRIPT_TODHRI),
-        "Todr" => Some(SCRIPT_TODHRI),
-        "Tolong_Siki" => Some(SCRIPT_TOLONG_SIKI),
-        "Tols" => Some(SCRIPT_TOLONG_SIKI),
-        "Toto" => Some(SCRIPT_TOTO),
-        "Tulu_Tigalari" => Some(SCRIPT_TULU_TIGALARI),
-        "Tutg" => Some(SCRIPT_TULU_TIGALARI),
-        "Ugar" => Some(SCRIPT_UGARITIC),
-        "Ugaritic" => Some(SCRIPT_UGARITIC),
-        "Unknown" => Some(SCRIPT_UNKNOWN),
-        "Zzzz" => Some(SCRIPT_UNKNOWN),
-        "Vai" => Some(SCRIPT_VAI),
-        "Vaii" => Some(SCRIPT_VAI),
-        "Vith" => Some(SCRIPT_VITHKUQI),
-        "Vithkuqi" => Some(SCRIPT_VITHKUQI),
-        "Wancho" => Some(SCRIPT_WANCHO),
-        "Wcho" => Some(SCRIPT_WANCHO),
-        "Wara" => Some(SCRIPT_WARANG_CITI),
-        "Warang_Citi" => Some(SCRIPT_WARANG_CITI),
-        "Yezi" => Some(SCRIPT_YEZIDI),
-        "Yezidi" => Some(SCRIPT_YEZIDI),
-        "Yi" => Some(SCRIPT_YI),
-        "Yiii" => Some(SCRIPT_YI),
-        "Zanabazar_Square" => Some(SCRIPT_ZANABAZAR_SQUARE),
-        "Zanb" => Some(SCRIPT_ZANABAZAR_SQUARE),
-        _ => None,
-    }
+    lookup_sorted(SCRIPT_BY_NAME, value)
 }
 
+static SCX_BY_NAME: &[(&str, &[(u32, u32)])] = &[
+    ("Adlam", SCX_ADLAM),
+    ("Adlm", SCX_ADLAM),
+    ("Aghb", SCX_CAUCASIAN_ALBANIAN),
+    ("Ahom", SCX_AHOM),
+    ("Anatolian_Hieroglyphs", SCX_ANATOLIAN_HIEROGLYPHS),
+    ("Arab", SCX_ARABIC),
+    ("Arabic", SCX_ARABIC),
+    ("Armenian", SCX_ARMENIAN),
+    ("Armi", SCX_IMPERIAL_ARAMAIC),
+    ("Armn", SCX_ARMENIAN),
+    ("Avestan", SCX_AVESTAN),
+    ("Avst", SCX_AVESTAN),
+    ("Bali", SCX_BALINESE),
+    ("Balinese", SCX_BALINESE),
+    ("Bamu", SCX_BAMUM),
+    ("Bamum", SCX_BAMUM),
+    ("Bass", SCX_BASSA_VAH),
+    ("Bassa_Vah", SCX_BASSA_VAH),
+    ("Batak", SCX_BATAK),
+    ("Batk", SCX_BATAK),
+    ("Beng", SCX_BENGALI),
+    ("Bengali", SCX_BENGALI),
+    ("Berf", SCX_BERIA_ERFE),
+    ("Beria_Erfe", SCX_BERIA_ERFE),
+    ("Bhaiksuki", SCX_BHAIKSUKI),
+    ("Bhks", SCX_BHAIKSUKI),
+    ("Bopo", SCX_BOPOMOFO),
+    ("Bopomofo", SCX_BOPOMOFO),
+    ("Brah", SCX_BRAHMI),
+    ("Brahmi", SCX_BRAHMI),
+    ("Brai", SCX_BRAILLE),
+    ("Braille", SCX_BRAILLE),
+    ("Bugi", SCX_BUGINESE),
+    ("Buginese", SCX_BUGINESE),
+    ("Buhd", SCX_BUHID),
+    ("Buhid", SCX_BUHID),
+    ("Cakm", SCX_CHAKMA),
+    ("Canadian_Aboriginal", SCX_CANADIAN_ABORIGINAL),
+    ("Cans", SCX_CANADIAN_ABORIGINAL),
+    ("Cari", SCX_CARIAN),
+    ("Carian", SCX_CARIAN),
+    ("Caucasian_Albanian", SCX_CAUCASIAN_ALBANIAN),
+    ("Chakma", SCX_CHAKMA),
+    ("Cham", SCX_CHAM),
+    ("Cher", SCX_CHEROKEE),
+    ("Cherokee", SCX_CHEROKEE),
+    ("Chorasmian", SCX_CHORASMIAN),
+    ("Chrs", SCX_CHORASMIAN),
+    ("Common", SCX_COMMON),
+    ("Copt", SCX_COPTIC),
+    ("Coptic", SCX_COPTIC),
+    ("Cpmn", SCX_CYPRO_MINOAN),
+    ("Cprt", SCX_CYPRIOT),
+    ("Cuneiform", SCX_CUNEIFORM),
+    ("Cypriot", SCX_CYPRIOT),
+    ("Cypro_Minoan", SCX_CYPRO_MINOAN),
+    ("Cyrillic", SCX_CYRILLIC),
+    ("Cyrl", SCX_CYRILLIC),
+    ("Deseret", SCX_DESERET),
+    ("Deva", SCX_DEVANAGARI),
+    ("Devanagari", SCX_DEVANAGARI),
+    ("Diak", SCX_DIVES_AKURU),
+    ("Dives_Akuru", SCX_DIVES_AKURU),
+    ("Dogr", SCX_DOGRA),
+    ("Dogra", SCX_DOGRA),
+    ("Dsrt", SCX_DESERET),
+    ("Dupl", SCX_DUPLOYAN),
+    ("Duployan", SCX_DUPLOYAN),
+    ("Egyp", SCX_EGYPTIAN_HIEROGLYPHS),
+    ("Egyptian_Hieroglyphs", SCX_EGYPTIAN_HIEROGLYPHS),
+    ("Elba", SCX_ELBASAN),
+    ("Elbasan", SCX_ELBASAN),
+    ("Elym", SCX_ELYMAIC),
+    ("Elymaic", SCX_ELYMAIC),
+    ("Ethi", SCX_ETHIOPIC),
+    ("Ethiopic", SCX_ETHIOPIC),
+    ("Gara", SCX_GARAY),
+    ("Garay", SCX_GARAY),
+    ("Geor", SCX_GEORGIAN),
+    ("Georgian", SCX_GEORGIAN),
+    ("Glag", SCX_GLAGOLITIC),
+    ("Glagolitic", SCX_GLAGOLITIC),
+    ("Gong", SCX_GUNJALA_GONDI),
+    ("Gonm", SCX_MASARAM_GONDI),
+    ("Goth", SCX_GOTHIC),
+    ("Gothic", SCX_GOTHIC),
+    ("Gran", SCX_GRANTHA),
+    ("Grantha", SCX_GRANTHA),
+    ("Greek", SCX_GREEK),
+    ("Grek", SCX_GREEK),
+    ("Gujarati", SCX_GUJARATI),
+    ("Gujr", SCX_GUJARATI),
+    ("Gukh", SCX_GURUNG_KHEMA),
+    ("Gunjala_Gondi", SCX_GUNJALA_GONDI),
+    ("Gurmukhi", SCX_GURMUKHI),
+    ("Guru", SCX_GURMUKHI),
+    ("Gurung_Khema", SCX_GURUNG_KHEMA),
+    ("Han", SCX_HAN),
+    ("Hang", SCX_HANGUL),
+    ("Hangul", SCX_HANGUL),
+    ("Hani", SCX_HAN),
+    ("Hanifi_Rohingya", SCX_HANIFI_ROHINGYA),
+    ("Hano", SCX_HANUNOO),
+    ("Hanunoo", SCX_HANUNOO),
+    ("Hatr", SCX_HATRAN),
+    ("Hatran", SCX_HATRAN),
+    ("Hebr", SCX_HEBREW),
+    ("Hebrew", SCX_HEBREW),
+    ("Hira", SCX_HIRAGANA),
+    ("Hiragana", SCX_HIRAGANA),
+    ("Hluw", SCX_ANATOLIAN_HIEROGLYPHS),
+    ("Hmng", SCX_PAHAWH_HMONG),
+    ("Hmnp", SCX_NYIAKENG_PUACHUE_HMONG),
+    ("Hung", SCX_OLD_HUNGARIAN),
+    ("Imperial_Aramaic", SCX_IMPERIAL_ARAMAIC),
+    ("Inherited", SCX_INHERITED),
+    ("Inscriptional_Pahlavi", SCX_INSCRIPTIONAL_PAHLAVI),
+    ("Inscriptional_Parthian", SCX_INSCRIPTIONAL_PARTHIAN),
+    ("Ital", SCX_OLD_ITALIC),
+    ("Java", SCX_JAVANESE),
+    ("Javanese", SCX_JAVANESE),
+    ("Kaithi", SCX_KAITHI),
+    ("Kali", SCX_KAYAH_LI),
+    ("Kana", SCX_KATAKANA),
+    ("Kannada", SCX_KANNADA),
+    ("Katakana", SCX_KATAKANA),
+    ("Kawi", SCX_KAWI),
+    ("Kayah_Li", SCX_KAYAH_LI),
+    ("Khar", SCX_KHAROSHTHI),
+    ("Kharoshthi", SCX_KHAROSHTHI),
+    ("Khitan_Small_Script", SCX_KHITAN_SMALL_SCRIPT),
+    ("Khmer", SCX_KHMER),
+    ("Khmr", SCX_KHMER),
+    ("Khoj", SCX_KHOJKI),
+    ("Khojki", SCX_KHOJKI),
+    ("Khudawadi", SCX_KHUDAWADI),
+    ("Kirat_Rai", SCX_KIRAT_RAI),
+    ("Kits", SCX_KHITAN_SMALL_SCRIPT),
+    ("Knda", SCX_KANNADA),
+    ("Krai", SCX_KIRAT_RAI),
+    ("Kthi", SCX_KAITHI),
+    ("Lana", SCX_TAI_THAM),
+    ("Lao", SCX_LAO),
+    ("Laoo", SCX_LAO),
+    ("Latin", SCX_LATIN),
+    ("Latn", SCX_LATIN),
+    ("Lepc", SCX_LEPCHA),
+    ("Lepcha", SCX_LEPCHA),
+    ("Limb", SCX_LIMBU),
+    ("Limbu", SCX_LIMBU),
+    ("Lina", SCX_LINEAR_A),
+    ("Linb", SCX_LINEAR_B),
+    ("Linear_A", SCX_LINEAR_A),
+    ("Linear_B", SCX_LINEAR_B),
+    ("Lisu", SCX_LISU),
+    ("Lyci", SCX_LYCIAN),
+    ("Lycian", SCX_LYCIAN),
+    ("Lydi", SCX_LYDIAN),
+    ("Lydian", SCX_LYDIAN),
+    ("Mahajani", SCX_MAHAJANI),
+    ("Mahj", SCX_MAHAJANI),
+    ("Maka", SCX_MAKASAR),
+    ("Makasar", SCX_MAKASAR),
+    ("Malayalam", SCX_MALAYALAM),
+    ("Mand", SCX_MANDAIC),
+    ("Mandaic", SCX_MANDAIC),
+    ("Mani", SCX_MANICHAEAN),
+    ("Manichaean", SCX_MANICHAEAN),
+    ("Marc", SCX_MARCHEN),
+    ("Marchen", SCX_MARCHEN),
+    ("Masaram_Gondi", SCX_MASARAM_GONDI),
+    ("Medefaidrin", SCX_MEDEFAIDRIN),
+    ("Medf", SCX_MEDEFAIDRIN),
+    ("Meetei_Mayek", SCX_MEETEI_MAYEK),
+    ("Mend", SCX_MENDE_KIKAKUI),
+    ("Mende_Kikakui", SCX_MENDE_KIKAKUI),
+    ("Merc", SCX_MEROITIC_CURSIVE),
+    ("Mero", SCX_MEROITIC_HIEROGLYPHS),
+    ("Meroitic_Cursive", SCX_MEROITIC_CURSIVE),
+    ("Meroitic_Hieroglyphs", SCX_MEROITIC_HIEROGLYPHS),
+    ("Miao", SCX_MIAO),
+    ("Mlym", SCX_MALAYALAM),
+    ("Modi", SCX_MODI),
+    ("Mong", SCX_MONGOLIAN),
+    ("Mongolian", SCX_MONGOLIAN),
+    ("Mro", SCX_MRO),
+    ("Mroo", SCX_MRO),
+    ("Mtei", SCX_MEETEI_MAYEK),
+    ("Mult", SCX_MULTANI),
+    ("Multani", SCX_MULTANI),
+    ("Myanmar", SCX_MYANMAR),
+    ("Mymr", SCX_MYANMAR),
+    ("Nabataean", SCX_NABATAEAN),
+    ("Nag_Mundari", SCX_NAG_MUNDARI),
+    ("Nagm", SCX_NAG_MUNDARI),
+    ("Nand", SCX_NANDINAGARI),
+    ("Nandinagari", SCX_NANDINAGARI),
+    ("Narb", SCX_OLD_NORTH_ARABIAN),
+    ("Nbat", SCX_NABATAEAN),
+    ("New_Tai_Lue", SCX_NEW_TAI_LUE),
+    ("Newa", SCX_NEWA),
+    ("Nko", SCX_NKO),
+    ("Nkoo", SCX_NKO),
+    ("Nshu", SCX_NUSHU),
+    ("Nushu", SCX_NUSHU),
+    ("Nyiakeng_Puachue_Hmong", SCX_NYIAKENG_PUACHUE_HMONG),
+    ("Ogam", SCX_OGHAM),
+    ("Ogham", SCX_OGHAM),
+    ("Ol_Chiki", SCX_OL_CHIKI),
+    ("Ol_Onal", SCX_OL_ONAL),
+    ("Olck", SCX_OL_CHIKI),
+    ("Old_Hungarian", SCX_OLD_HUNGARIAN),
+    ("Old_Italic", SCX_OLD_ITALIC),
+    ("Old_North_Arabian", SCX_OLD_NORTH_ARABIAN),
+    ("Old_Permic", SCX_OLD_PERMIC),
+    ("Old_Persian", SCX_OLD_PERSIAN),
+    ("Old_Sogdian", SCX_OLD_SOGDIAN),
+    ("Old_South_Arabian", SCX_OLD_SOUTH_ARABIAN),
+    ("Old_Turkic", SCX_OLD_TURKIC),
+    ("Old_Uyghur", SCX_OLD_UYGHUR),
+    ("Onao", SCX_OL_ONAL),
+    ("Oriya", SCX_ORIYA),
+    ("Orkh", SCX_OLD_TURKIC),
+    ("Orya", SCX_ORIYA),
+    ("Osage", SCX_OSAGE),
+    ("Osge", SCX_OSAGE),
+    ("Osma", SCX_OSMANYA),
+    ("Osmanya", SCX_OSMANYA),
+    ("Ougr", SCX_OLD_UYGHUR),
+    ("Pahawh_Hmong", SCX_PAHAWH_HMONG),
+    ("Palm", SCX_PALMYRENE),
+    ("Palmyrene", SCX_PALMYRENE),
+    ("Pau_Cin_Hau", SCX_PAU_CIN_HAU),
+    ("Pauc", SCX_PAU_CIN_HAU),
+    ("Perm", SCX_OLD_PERMIC),
+    ("Phag", SCX_PHAGS_PA),
+    ("Phags_Pa", SCX_PHAGS_PA),
+    ("Phli", SCX_INSCRIPTIONAL_PAHLAVI),
+    ("Phlp", SCX_PSALTER_PAHLAVI),
+    ("Phnx", SCX_PHOENICIAN),
+    ("Phoenician", SCX_PHOENICIAN),
+    ("Plrd", SCX_MIAO),
+    ("Prti", SCX_INSCRIPTIONAL_PARTHIAN),
+    ("Psalter_Pahlavi", SCX_PSALTER_PAHLAVI),
+    ("Qaac", SCX_COPTIC),
+    ("Qaai", SCX_INHERITED),
+    ("Rejang", SCX_REJANG),
+    ("Rjng", SCX_REJANG),
+    ("Rohg", SCX_HANIFI_ROHINGYA),
+    ("Runic", SCX_RUNIC),
+    ("Runr", SCX_RUNIC),
+    ("Samaritan", SCX_SAMARITAN),
+    ("Samr", SCX_SAMARITAN),
+    ("Sarb", SCX_OLD_SOUTH_ARABIAN),
+    ("Saur", SCX_SAURASHTRA),
+    ("Saurashtra", SCX_SAURASHTRA),
+    ("Sgnw", SCX_SIGNWRITING),
+    ("Sharada", SCX_SHARADA),
+    ("Shavian", SCX_SHAVIAN),
+    ("Shaw", SCX_SHAVIAN),
+    ("Shrd", SCX_SHARADA),
+    ("Sidd", SCX_SIDDHAM),
+    ("Siddham", SCX_SIDDHAM),
+    ("Sidetic", SCX_SIDETIC),
+    ("Sidt", SCX_SIDETIC),
+    ("SignWriting", SCX_SIGNWRITING),
+    ("Sind", SCX_KHUDAWADI),
+    ("Sinh", SCX_SINHALA),
+    ("Sinhala", SCX_SINHALA),
+    ("Sogd", SCX_SOGDIAN),
+    ("Sogdian", SCX_SOGDIAN),
+    ("Sogo", SCX_OLD_SOGDIAN),
+    ("Sora", SCX_SORA_SOMPENG),
+    ("Sora_Sompeng", SCX_SORA_SOMPENG),
+    ("Soyo", SCX_SOYOMBO),
+    ("Soyombo", SCX_SOYOMBO),
+    ("Sund", SCX_SUNDANESE),
+    ("Sundanese", SCX_SUNDANESE),
+    ("Sunu", SCX_SUNUWAR),
+    ("Sunuwar", SCX_SUNUWAR),
+    ("Sylo", SCX_SYLOTI_NAGRI),
+    ("Syloti_Nagri", SCX_SYLOTI_NAGRI),
+    ("Syrc", SCX_SYRIAC),
+    ("Syriac", SCX_SYRIAC),
+    ("Tagalog", SCX_TAGALOG),
+    ("Tagb", SCX_TAGBANWA),
+    ("Tagbanwa", SCX_TAGBANWA),
+    ("Tai_Le", SCX_TAI_LE),
+    ("Tai_Tham", SCX_TAI_THAM),
+    ("Tai_Viet", SCX_TAI_VIET),
+    ("Tai_Yo", SCX_TAI_YO),
+    ("Takr", SCX_TAKRI),
+    ("Takri", SCX_TAKRI),
+    ("Tale", SCX_TAI_LE),
+    ("Talu", SCX_NEW_TAI_LUE),
+    ("Tamil", SCX_TAMIL),
+    ("Taml", SCX_TAMIL),
+    ("Tang", SCX_TANGUT),
+    ("Tangsa", SCX_TANGSA),
+    ("Tangut", SCX_TANGUT),
+    ("Tavt", SCX_TAI_VIET),
+    ("Tayo", SCX_TAI_YO),
+    ("Telu", SCX_TELUGU),
+    ("Telugu", SCX_TELUGU),
+    ("Tfng", SCX_TIFINAGH),
+    ("Tglg", SCX_TAGALOG),
+    ("Thaa", SCX_THAANA),
+    ("Thaana", SCX_THAANA),
+    ("Thai", SCX_THAI),
+    ("Tibetan", SCX_TIBETAN),
+    ("Tibt", SCX_TIBETAN),
+    ("Tifinagh", SCX_TIFINAGH),
+    ("Tirh", SCX_TIRHUTA),
+    ("Tirhuta", SCX_TIRHUTA),
+    ("Tnsa", SCX_TANGSA),
+    ("Todhri", SCX_TODHRI),
+    ("Todr", SCX_TODHRI),
+    ("Tolong_Siki", SCX_TOLONG_SIKI),
+    ("Tols", SCX_TOLONG_SIKI),
+    ("Toto", SCX_TOTO),
+    ("Tulu_Tigalari", SCX_TULU_TIGALARI),
+    ("Tutg", SCX_TULU_TIGALARI),
+    ("Ugar", SCX_UGARITIC),
+    ("Ugaritic", SCX_UGARITIC),
+    ("Unknown", SCX_UNKNOWN),
+    ("Vai", SCX_VAI),
+    ("Vaii", SCX_VAI),
+    ("Vith", SCX_VITHKUQI),
+    ("Vithkuqi", SCX_VITHKUQI),
+    ("Wancho", SCX_WANCHO),
+    ("Wara", SCX_WARANG_CITI),
+    ("Warang_Citi", SCX_WARANG_CITI),
+    ("Wcho", SCX_WANCHO),
+    ("Xpeo", SCX_OLD_PERSIAN),
+    ("Xsux", SCX_CUNEIFORM),
+    ("Yezi", SCX_YEZIDI),
+    ("Yezidi", SCX_YEZIDI),
+    ("Yi", SCX_YI),
+    ("Yiii", SCX_YI),
+    ("Zanabazar_Square", SCX_ZANABAZAR_SQUARE),
+    ("Zanb", SCX_ZANABAZAR_SQUARE),
+    ("Zinh", SCX_INHERITED),
+    ("Zyyy", SCX_COMMON),
+    ("Zzzz", SCX_UNKNOWN),
+];
+
 fn lookup_script_extensions(value: &str) -> Option<&'static [(u32, u32)]> {
-    match value {
-        "Adlam" => Some(SCX_ADLAM),
-        "Adlm" => Some(SCX_ADLAM),
-        "Ahom" => Some(SCX_AHOM),
-        "Anatolian_Hieroglyphs" => Some(SCX_ANATOLIAN_HIEROGLYPHS),
-        "Hluw" => Some(SCX_ANATOLIAN_HIEROGLYPHS),
-        "Arab" => Some(SCX_ARABIC),
-        "Arabic" => Some(SCX_ARABIC),
-        "Armenian" => Some(SCX_ARMENIAN),
-        "Armn" => Some(SCX_ARMENIAN),
-        "Avestan" => Some(SCX_AVESTAN),
-        "Avst" => Some(SCX_AVESTAN),
-        "Bali" => Some(SCX_BALINESE),
-        "Balinese" => Some(SCX_BALINESE),
-        "Bamu" => Some(SCX_BAMUM),
-        "Bamum" => Some(SCX_BAMUM),
-        "Bass" => Some(SCX_BASSA_VAH),
-        "Bassa_Vah" => Some(SCX_BASSA_VAH),
-        "Batak" => Some(SCX_BATAK),
-        "Batk" => Some(SCX_BATAK),
-        "Beng" => Some(SCX_BENGALI),
-        "Bengali" => Some(SCX_BENGALI),
-        "Berf" => Some(SCX_BERIA_ERFE),
-        "Beria_Erfe" => Some(SCX_BERIA_ERFE),
-        "Bhaiksuki" => Some(SCX_BHAIKSUKI),
-        "Bhks" => Some(SCX_BHAIKSUKI),
-        "Bopo" => Some(SCX_BOPOMOFO),
-        "Bopomofo" => Some(SCX_BOPOMOFO),
-        "Brah" => Some(SCX_BRAHMI),
-        "Brahmi" => Some(SCX_BRAHMI),
-        "Brai" => Some(SCX_BRAILLE),
-        "Braille" => Some(SCX_BRAILLE),
-        "Bugi" => Some(SCX_BUGINESE),
-        "Buginese" => Some(SCX_BUGINESE),
-        "Buhd" => Some(SCX_BUHID),
-        "Buhid" => Some(SCX_BUHID),
-        "Canadian_Aboriginal" => Some(SCX_CANADIAN_ABORIGINAL),
-        "Cans" => Some(SCX_CANADIAN_ABORIGINAL),
-        "Cari" => Some(SCX_CARIAN),
-        "Carian" => Some(SCX_CARIAN),
-        "Aghb" => Some(SCX_CAUCASIAN_ALBANIAN),
-        "Caucasian_Albanian" => Some(SCX_CAUCASIAN_ALBANIAN),
-        "Cakm" => Some(SCX_CHAKMA),
-        "Chakma" => Some(SCX_CHAKMA),
-        "Cham" => Some(SCX_CHAM),
-        "Cher" => Some(SCX_CHEROKEE),
-        "Cherokee" => Some(SCX_CHEROKEE),
-        "Chorasmian" => Some(SCX_CHORASMIAN),
-        "Chrs" => Some(SCX_CHORASMIAN),
-        "Common" => Some(SCX_COMMON),
-        "Zyyy" => Some(SCX_COMMON),
-        "Copt" => Some(SCX_COPTIC),
-        "Coptic" => Some(SCX_COPTIC),
-        "Qaac" => Some(SCX_COPTIC),
-        "Cuneiform" => Some(SCX_CUNEIFORM),
-        "Xsux" => Some(SCX_CUNEIFORM),
-        "Cprt" => Some(SCX_CYPRIOT),
-        "Cypriot" => Some(SCX_CYPRIOT),
-        "Cpmn" => Some(SCX_CYPRO_MINOAN),
-        "Cypro_Minoan" => Some(SCX_CYPRO_MINOAN),
-        "Cyrillic" => Some(SCX_CYRILLIC),
-        "Cyrl" => Some(SCX_CYRILLIC),
-        "Deseret" => Some(SCX_DESERET),
-        "Dsrt" => Some(SCX_DESERET),
-        "Deva" => Some(SCX_DEVANAGARI),
-        "Devanagari" => Some(SCX_DEVANAGARI),
-        "Diak" => Some(SCX_DIVES_AKURU),
-        "Dives_Akuru" => Some(SCX_DIVES_AKURU),
-        "Dogr" => Some(SCX_DOGRA),
-        "Dogra" => Some(SCX_DOGRA),
-        "Dupl" => Some(SCX_DUPLOYAN),
-        "Duployan" => Some(SCX_DUPLOYAN),
-        "Egyp" => Some(SCX_EGYPTIAN_HIEROGLYPHS),
-        "Egyptian_Hieroglyphs" => Some(SCX_EGYPTIAN_HIEROGLYPHS),
-        "Elba" => Some(SCX_ELBASAN),
-        "Elbasan" => Some(SCX_ELBASAN),
-        "Elym" => Some(SCX_ELYMAIC),
-        "Elymaic" => Some(SCX_ELYMAIC),
-        "Ethi" => Some(SCX_ETHIOPIC),
-        "Ethiopic" => Some(SCX_ETHIOPIC),
-        "Gara" => Some(SCX_GARAY),
-        "Garay" => Some(SCX_GARAY),
-        "Geor" => Some(SCX_GEORGIAN),
-        "Georgian" => Some(SCX_GEORGIAN),
-        "Glag" => Some(SCX_GLAGOLITIC),
-        "Glagolitic" => Some(SCX_GLAGOLITIC),
-        "Goth" => Some(SCX_GOTHIC),
-        "Gothic" => Some(SCX_GOTHIC),
-        "Gran" => Some(SCX_GRANTHA),
-        "Grantha" => Some(SCX_GRANTHA),
-        "Greek" => Some(SCX_GREEK),
-        "Grek" => Some(SCX_GREEK),
-        "Gujarati" => Some(SCX_GUJARATI),
-        "Gujr" => Some(SCX_GUJARATI),
-        "Gong" => Some(SCX_GUNJALA_GONDI),
-        "Gunjala_Gondi" => Some(SCX_GUNJALA_GONDI),
-        "Gurmukhi" => Some(SCX_GURMUKHI),
-        "Guru" => Some(SCX_GURMUKHI),
-        "Gukh" => Some(SCX_GURUNG_KHEMA),
-        "Gurung_Khema" => Some(SCX_GURUNG_KHEMA),
-        "Han" => Some(SCX_HAN),
-        "Hani" => Some(SCX_HAN),
-        "Hang" => Some(SCX_HANGUL),
-        "Hangul" => Some(SCX_HANGUL),
-        "Hanifi_Rohingya" => Some(SCX_HANIFI_ROHINGYA),
-        "Rohg" => Some(SCX_HANIFI_ROHINGYA),
-        "Hano" => Some(SCX_HANUNOO),
-        "Hanunoo" => Some(SCX_HANUNOO),
-        "Hatr" => Some(SCX_HATRAN),
-        "Hatran" => Some(SCX_HATRAN),
-        "Hebr" => Some(SCX_HEBREW),
-        "Hebrew" => Some(SCX_HEBREW),
-        "Hira" => Some(SCX_HIRAGANA),
-        "Hiragana" => Some(SCX_HIRAGANA),
-        "Armi" => Some(SCX_IMPERIAL_ARAMAIC),
-        "Imperial_Aramaic" => Some(SCX_IMPERIAL_ARAMAIC),
-        "Inherited" => Some(SCX_INHERITED),
-        "Qaai" => Some(SCX_INHERITED),
-        "Zinh" => Some(SCX_INHERITED),
-        "Inscriptional_Pahlavi" => Some(SCX_INSCRIPTIONAL_PAHLAVI),
-        "Phli" => Some(SCX_INSCRIPTIONAL_PAHLAVI),
-        "Inscriptional_Parthian" => Some(SCX_INSCRIPTIONAL_PARTHIAN),
-        "Prti" => Some(SCX_INSCRIPTIONAL_PARTHIAN),
-        "Java" => Some(SCX_JAVANESE),
-        "Javanese" => Some(SCX_JAVANESE),
-        "Kaithi" => Some(SCX_KAITHI),
-        "Kthi" => Some(SCX_KAITHI),
-        "Kannada" => Some(SCX_KANNADA),
-        "Knda" => Some(SCX_KANNADA),
-        "Kana" => Some(SCX_KATAKANA),
-        "Katakana" => Some(SCX_KATAKANA),
-        "Kawi" => Some(SCX_KAWI),
-        "Kali" => Some(SCX_KAYAH_LI),
-        "Kayah_Li" => Some(SCX_KAYAH_LI),
-        "Khar" => Some(SCX_KHAROSHTHI),
-        "Kharoshthi" => Some(SCX_KHAROSHTHI),
-        "Khitan_Small_Script" => Some(SCX_KHITAN_SMALL_SCRIPT),
-        "Kits" => Some(SCX_KHITAN_SMALL_SCRIPT),
-        "Khmer" => Some(SCX_KHMER),
-        "Khmr" => Some(SCX_KHMER),
-        "Khoj" => Some(SCX_KHOJKI),
-        "Khojki" => Some(SCX_KHOJKI),
-        "Khudawadi" => Some(SCX_KHUDAWADI),
-        "Sind" => Some(SCX_KHUDAWADI),
-        "Kirat_Rai" => Some(SCX_KIRAT_RAI),
-        "Krai" => Some(SCX_KIRAT_RAI),
-        "Lao" => Some(SCX_LAO),
-        "Laoo" => Some(SCX_LAO),
-        "Latin" => Some(SCX_LATIN),
-        "Latn" => Some(SCX_LATIN),
-        "Lepc" => Some(SCX_LEPCHA),
-        "Lepcha" => Some(SCX_LEPCHA),
-        "Limb" => Some(SCX_LIMBU),
-        "Limbu" => Some(SCX_LIMBU),
-        "Lina" => Some(SCX_LINEAR_A),
-        "Linear_A" => Some(SCX_LINEAR_A),
-        "Linb" => Some(SCX_LINEAR_B),
-        "Linear_B" => Some(SCX_LINEAR_B),
-        "Lisu" => Some(SCX_LISU),
-        "Lyci" => Some(SCX_LYCIAN),
-        "Lycian" => Some(SCX_LYCIAN),
-        "Lydi" => Some(SCX_LYDIAN),
-        "Lydian" => Some(SCX_LYDIAN),
-        "Mahajani" => Some(SCX_MAHAJANI),
-        "Mahj" => Some(SCX_MAHAJANI),
-        "Maka" => Some(SCX_MAKASAR),
-        "Makasar" => Some(SCX_MAKASAR),
-        "Malayalam" => Some(SCX_MALAYALAM),
-        "Mlym" => Some(SCX_MALAYALAM),
-        "Mand" => Some(SCX_MANDAIC),
-        "Mandaic" => Some(SCX_MANDAIC),
-        "Mani" => Some(SCX_MANICHAEAN),
-        "Manichaean" => Some(SCX_MANICHAEAN),
-        "Marc" => Some(SCX_MARCHEN),
-        "Marchen" => Some(SCX_MARCHEN),
-        "Gonm" => Some(SCX_MASARAM_GONDI),
-        "Masaram_Gondi" => Some(SCX_MASARAM_GONDI),
-        "Medefaidrin" => Some(SCX_MEDEFAIDRIN),
-        "Medf" => Some(SCX_MEDEFAIDRIN),
-        "Meetei_Mayek" => Some(SCX_MEETEI_MAYEK),
-        "Mtei" => Some(SCX_MEETEI_MAYEK),
-        "Mend" => Some(SCX_MENDE_KIKAKUI),
-        "Mende_Kikakui" => Some(SCX_MENDE_KIKAKUI),
-        "Merc" => Some(SCX_MEROITIC_CURSIVE),
-        "Meroitic_Cursive" => Some(SCX_MEROITIC_CURSIVE),
-        "Mero" => Some(SCX_MEROITIC_HIEROGLYPHS),
-        "Meroitic_Hieroglyphs" => Some(SCX_MEROITIC_HIEROGLYPHS),
-        "Miao" => Some(SCX_MIAO),
-        "Plrd" => Some(SCX_MIAO),
-        "Modi" => Some(SCX_MODI),
-        "Mong" => Some(SCX_MONGOLIAN),
-        "Mongolian" => Some(SCX_MONGOLIAN),
-        "Mro" => Some(SCX_MRO),
-        "Mroo" => Some(SCX_MRO),
-        "Mult" => Some(SCX_MULTANI),
-        "Multani" => Some(SCX_MULTANI),
-        "Myanmar" => Some(SCX_MYANMAR),
-        "Mymr" => Some(SCX_MYANMAR),
-        "Nabataean" => Some(SCX_NABATAEAN),
-        "Nbat" => Some(SCX_NABATAEAN),
-        "Nag_Mundari" => Some(SCX_NAG_MUNDARI),
-        "Nagm" => Some(SCX_NAG_MUNDARI),
-        "Nand" => Some(SCX_NANDINAGARI),
-        "Nandinagari" => Some(SCX_NANDINAGARI),
-        "New_Tai_Lue" => Some(SCX_NEW_TAI_LUE),
-        "Talu" => Some(SCX_NEW_TAI_LUE),
-        "Newa" => Some(SCX_NEWA),
-        "Nko" => Some(SCX_NKO),
-        "Nkoo" => Some(SCX_NKO),
-        "Nshu" => Some(SCX_NUSHU),
-        "Nushu" => Some(SCX_NUSHU),
-        "Hmnp" => Some(SCX_NYIAKENG_PUACHUE_HMONG),
-        "Nyiakeng_Puachue_Hmong" => Some(SCX_NYIAKENG_PUACHUE_HMONG),
-        "Ogam" => Some(SCX_OGHAM),
-        "Ogham" => Some(SCX_OGHAM),
-        "Ol_Chiki" => Some(SCX_OL_CHIKI),
-        "Olck" => Some(SCX_OL_CHIKI),
-        "Ol_Onal" => Some(SCX_OL_ONAL),
-        "Onao" => Some(SCX_OL_ONAL),
-        "Hung" => Some(SCX_OLD_HUNGARIAN),
-        "Old_Hungarian" => Some(SCX_OLD_HUNGARIAN),
-        "Ital" => Some(SCX_OLD_ITALIC),
-        "Old_Italic" => Some(SCX_OLD_ITALIC),
-        "Narb" => Some(SCX_OLD_NORTH_ARABIAN),
-        "Old_North_Arabian" => Some(SCX_OLD_NORTH_ARABIAN),
-        "Old_Permic" => Some(SCX_OLD_PERMIC),
-        "Perm" => Some(SCX_OLD_PERMIC),
-        "Old_Persian" => Some(SCX_OLD_PERSIAN),
-        "Xpeo" => Some(SCX_OLD_PERSIAN),
-        "Old_Sogdian" => Some(SCX_OLD_SOGDIAN),
-        "Sogo" => Some(SCX_OLD_SOGDIAN),
-        "Old_South_Arabian" => Some(SCX_OLD_SOUTH_ARABIAN),
-        "Sarb" => Some(SCX_OLD_SOUTH_ARABIAN),
-        "Old_Turkic" => Some(SCX_OLD_TURKIC),
-        "Orkh" => Some(SCX_OLD_TURKIC),
-        "Old_Uyghur" => Some(SCX_OLD_UYGHUR),
-        "Ougr" => Some(SCX_OLD_UYGHUR),
-        "Oriya" => Some(SCX_ORIYA),
-        "Orya" => Some(SCX_ORIYA),
-        "Osage" => Some(SCX_OSAGE),
-        "Osge" => Some(SCX_OSAGE),
-        "Osma" => Some(SCX_OSMANYA),
-        "Osmanya" => Some(SCX_OSMANYA),
-        "Hmng" => Some(SCX_PAHAWH_HMONG),
-        "Pahawh_Hmong" => Some(SCX_PAHAWH_HMONG),
-        "Palm" => Some(SCX_PALMYRENE),
-        "Palmyrene" => Some(SCX_PALMYRENE),
-        "Pau_Cin_Hau" => Some(SCX_PAU_CIN_HAU),
-        "Pauc" => Some(SCX_PAU_CIN_HAU),
-        "Phag" => Some(SCX_PHAGS_PA),
-        "Phags_Pa" => Some(SCX_PHAGS_PA),
-        "Phnx" => Some(SCX_PHOENICIAN),
-        "Phoenician" => Some(SCX_PHOENICIAN),
-        "Phlp" => Some(SCX_PSALTER_PAHLAVI),
-        "Psalter_Pahlavi" => Some(SCX_PSALTER_PAHLAVI),
-        "Rejang" => Some(SCX_REJANG),
-        "Rjng" => Some(SCX_REJANG),
-        "Runic" => Some(SCX_RUNIC),
-        "Runr" => Some(SCX_RUNIC),
-        "Samaritan" => Some(SCX_SAMARITAN),
-        "Samr" => Some(SCX_SAMARITAN),
-        "Saur" => Some(SCX_SAURASHTRA),
-        "Saurashtra" => Some(SCX_SAURASHTRA),
-        "Sharada" => Some(SCX_SHARADA),
-        "Shrd" => Some(SCX_SHARADA),
-        "Shavian" => Some(SCX_SHAVIAN),
-        "Shaw" => Some(SCX_SHAVIAN),
-        "Sidd" => Some(SCX_SIDDHAM),
-        "Siddham" => Some(SCX_SIDDHAM),
-        "Sidetic" => Some(SCX_SIDETIC),
-        "Sidt" => Some(SCX_SIDETIC),
-        "Sgnw" => Some(SCX_SIGNWRITING),
-        "SignWriting" => Some(SCX_SIGNWRITING),
-        "Sinh" => Some(SCX_SINHALA),
-        "Sinhala" => Some(SCX_SINHALA),
-        "Sogd" => Some(SCX_SOGDIAN),
-        "Sogdian" => Some(SCX_SOGDIAN),
-        "Sora" => Some(SCX_SORA_SOMPENG),
-        "Sora_Sompeng" => Some(SCX_SORA_SOMPENG),
-        "Soyo" => Some(SCX_SOYOMBO),
-        "Soyombo" => Some(SCX_SOYOMBO),
-        "Sund" => Some(SCX_SUNDANESE),
-        "Sundanese" => Some(SCX_SUNDANESE),
-        "Sunu" => Some(SCX_SUNUWAR),
-        "Sunuwar" => Some(SCX_SUNUWAR),
-        "Sylo" => Some(SCX_SYLOTI_NAGRI),
-        "Syloti_Nagri" => Some(SCX_SYLOTI_NAGRI),
-        "Syrc" => Some(SCX_SYRIAC),
-        "Syriac" => Some(SCX_SYRIAC),
-        "Tagalog" => Some(SCX_TAGALOG),
-        "Tglg" => Some(SCX_TAGALOG),
-        "Tagb" => Some(SCX_TAGBANWA),
-        "Tagbanwa" => Some(SCX_TAGBANWA),
-        "Tai_Le" => Some(SCX_TAI_LE),
-        "Tale" => Some(SCX_TAI_LE),
-        "Lana" => Some(SCX_TAI_THAM),
-        "Tai_Tham" => Some(SCX_TAI_THAM),
-        "Tai_Viet" => Some(SCX_TAI_VIET),
-        "Tavt" => Some(SCX_TAI_VIET),
-        "Tai_Yo" => Some(SCX_TAI_YO),
-        "Tayo" => Some(SCX_TAI_YO),
-        "Takr" => Some(SCX_TAKRI),
-        "Takri" => Some(SCX_TAKRI),
-        "Tamil" => Some(SCX_TAMIL),
-        "Taml" => Some(SCX_TAMIL),
-        "Tangsa" => Some(SCX_TANGSA),
-        "Tnsa" => Some(SCX_TANGSA),
-        "Tang" => Some(SCX_TANGUT),
-        "Tangut" => Some(SCX_TANGUT),
-        "Telu" => Some(SCX_TELUGU),
-        "Telugu" => Some(SCX_TELUGU),
-        "Thaa" => Some(SCX_THAANA),
-        "Thaana" => Some(SCX_THAANA),
-        "Thai" => Some(SCX_THAI),
-        "Tibetan" => Some(SCX_TIBETAN),
-        "Tibt" => Some(SCX_TIBETAN),
-        "Tfng" => Some(SCX_TIFINAGH),
-        "Tifinagh" => Some(SCX_TIFINAGH),
-        "Tirh" => Some(SCX_TIRHUTA),
-        "Tirhuta" => Some(SCX_TIRHUTA),
-        "Todhri" => Some(SCX_TODHRI),
-        "Todr" => Some(SCX_TODHRI),
-        "Tolong_Siki" => Some(SCX_TOLONG_SIKI),
-        "Tols" => Some(SCX_TOLONG_SIKI),
-        "Toto" => Some(SCX_TOTO),
-        "Tulu_Tigalari" => Some(SCX_TULU_TIGALARI),
-        "Tutg" => Some(SCX_TULU_TIGALARI),
-        "Ugar" => Some(SCX_UGARITIC),
-        "Ugaritic" => Some(SCX_UGARITIC),
-        "Unknown" => Some(SCX_UNKNOWN),
-        "Zzzz" => Some(SCX_UNKNOWN),
-        "Vai" => Some(SCX_VAI),
-        "Vaii" => Some(SCX_VAI),
-        "Vith" => Some(SCX_VITHKUQI),
-        "Vithkuqi" => Some(SCX_VITHKUQI),
-        "Wancho" => Some(SCX_WANCHO),
-        "Wcho" => Some(SCX_WANCHO),
-        "Wara" => Some(SCX_WARANG_CITI),
-        "Warang_Citi" => Some(SCX_WARANG_CITI),
-        "Yezi" => Some(SCX_YEZIDI),
-        "Yezidi" => Some(SCX_YEZIDI),
-        "Yi" => Some(SCX_YI),
-        "Yiii" => Some(SCX_YI),
-        "Zanabazar_Square" => Some(SCX_ZANABAZAR_SQUARE),
-        "Zanb" => Some(SCX_ZANABAZAR_SQUARE),
-        _ => None,
-    }
+    lookup_sorted(SCX_BY_NAME, value)
 }
 
+static GC_BY_NAME: &[(&str, &[(u32, u32)])] = &[
+    ("C", GC_C),
+    ("Cased_Letter", GC_LC),
+    ("Cc", GC_CC),
+    ("Cf", GC_CF),
+    ("Close_Punctuation", GC_PE),
+    ("Cn", GC_CN),
+    ("Co", GC_CO),
+    ("Combining_Mark", GC_M),
+    ("Connector_Punctuation", GC_PC),
+    ("Control", GC_CC),
+    ("Cs", GC_CS),
+    ("Currency_Symbol", GC_SC),
+    ("Dash_Punctuation", GC_PD),
+    ("Decimal_Number", GC_ND),
+    ("Enclosing_Mark", GC_ME),
+    ("Final_Punctuation", GC_PF),
+    ("Format", GC_CF),
+    ("Initial_Punctuation", GC_PI),
+    ("L", GC_L),
+    ("LC", GC_LC),
+    ("Letter", GC_L),
+    ("Letter_Number", GC_NL),
+    ("Line_Separator", GC_ZL),
+    ("Ll", GC_LL),
+    ("Lm", GC_LM),
+    ("Lo", GC_LO),
+    ("Lowercase_Letter", GC_LL),
+    ("Lt", GC_LT),
+    ("Lu", GC_LU),
+    ("M", GC_M),
+    ("Mark", GC_M),
+    ("Math_Symbol", GC_SM),
+    ("Mc", GC_MC),
+    ("Me", GC_ME),
+    ("Mn", GC_MN),
+    ("Modifier_Letter", GC_LM),
+    ("Modifier_Symbol", GC_SK),
+    ("N", GC_N),
+    ("Nd", GC_ND),
+    ("Nl", GC_NL),
+    ("No", GC_NO),
+    ("Nonspacing_Mark", GC_MN),
+    ("Number", GC_N),
+    ("Open_Punctuation", GC_PS),
+    ("Other", GC_C),
+    ("Other_Letter", GC_LO),
+    ("Other_Number", GC_NO),
+    ("Other_Punctuation", GC_PO),
+    ("Other_Symbol", GC_SO),
+    ("P", GC_P),
+    ("Paragraph_Separator", GC_ZP),
+    ("Pc", GC_PC),
+    ("Pd", GC_PD),
+    ("Pe", GC_PE),
+    ("Pf", GC_PF),
+    ("Pi", GC_PI),
+    ("Po", GC_PO),
+    ("Private_Use", GC_CO),
+    ("Ps", GC_PS),
+    ("Punctuation", GC_P),
+    ("S", GC_S),
+    ("Sc", GC_SC),
+    ("Separator", GC_Z),
+    ("Sk", GC_SK),
+    ("Sm", GC_SM),
+    ("So", GC_SO),
+    ("Space_Separator", GC_ZS),
+    ("Spacing_Mark", GC_MC),
+    ("Surrogate", GC_CS),
+    ("Symbol", GC_S),
+    ("Titlecase_Letter", GC_LT),
+    ("Unassigned", GC_CN),
+    ("Uppercase_Letter", GC_LU),
+    ("Z", GC_Z),
+    ("Zl", GC_ZL),
+    ("Zp", GC_ZP),
+    ("Zs", GC_ZS),
+    ("cntrl", GC_CC),
+    ("digit", GC_ND),
+    ("punct", GC_P),
+];
+
 fn lookup_gc(value: &str) -> Option<&'static [(u32, u32)]> {
-    match value {
-        "C" => Some(GC_C),
-        "Other" => Some(GC_C),
-        "Cc" => Some(GC_CC),
-        "Control" => Some(GC_CC),
-        "cntrl" => Some(GC_CC),
-        "Cf" => Some(GC_CF),
-        "Format" => Some(GC_CF),
-        "Cn" => Some(GC_CN),
-        "Unassigned" => Some(GC_CN),
-        "Co" => Some(GC_CO),
-        "Private_Use" => Some(GC_CO),
-        "Cs" => Some(GC_CS),
-        "Surrogate" => Some(GC_CS),
-        "L" => Some(GC_L),
-        "Letter" => Some(GC_L),
-        "Cased_Letter" => Some(GC_LC),
-        "LC" => Some(GC_LC),
-        "Ll" => Some(GC_LL),
-        "Lowercase_Letter" => Some(GC_LL),
-        "Lm" => Some(GC_LM),
-        "Modifier_Letter" => Some(GC_LM),
-        "Lo" => Some(GC_LO),
-        "Other_Letter" => Some(GC_LO),
-        "Lt" => Some(GC_LT),
-        "Titlecase_Letter" => Some(GC_LT),
-        "Lu" => Some(GC_LU),
-        "Uppercase_Letter" => Some(GC_LU),
-        "Combining_Mark" => Some(GC_M),
-        "M" => Some(GC_M),
-        "Mark" => Some(GC_M),
-        "Mc" => Some(GC_MC),
-        "Spacing_Mark" => Some(GC_MC),
-        "Enclosing_Mark" => Some(GC_ME),
-        "Me" => Some(GC_ME),
-        "Mn" => Some(GC_MN),
-        "Nonspacing_Mark" => Some(GC_MN),
-        "N" => Some(GC_N),
-        "Number" => Some(GC_N),
-        "Decimal_Number" => Some(GC_ND),
-        "Nd" => Some(GC_ND),
-        "digit" => Some(GC_ND),
-        "Letter_Number" => Some(GC_NL),
-        "Nl" => Some(GC_NL),
-        "No" => Some(GC_NO),
-        "Other_Number" => Some(GC_NO),
-        "P" => Some(GC_P),
-        "Punctuation" => Some(GC_P),
-        "punct" => Some(GC_P),
-        "Connector_Punctuation" => Some(GC_PC),
-        "Pc" => Some(GC_PC),
-        "Dash_Punctuation" => Some(GC_PD),
-        "Pd" => Some(GC_PD),
-        "Close_Punctuation" => Some(GC_PE),
-        "Pe" => Some(GC_PE),
-        "Final_Punctuation" => Some(GC_PF),
-        "Pf" => Some(GC_PF),
-        "Initial_Punctuation" => Some(GC_PI),
-        "Pi" => Some(GC_PI),
-        "Other_Punctuation" => Some(GC_PO),
-        "Po" => Some(GC_PO),
-        "Open_Punctuation" => Some(GC_PS),
-        "Ps" => Some(GC_PS),
-        "S" => Some(GC_S),
-        "Symbol" => Some(GC_S),
-        "Currency_Symbol" => Some(GC_SC),
-        "Sc" => Some(GC_SC),
-        "Modifier_Symbol" => Some(GC_SK),
-        "Sk" => Some(GC_SK),
-        "Math_Symbol" => Some(GC_SM),
-        "Sm" => Some(GC_SM),
-        "Other_Symbol" => Some(GC_SO),
-        "So" => Some(GC_SO),
-        "Separator" => Some(GC_Z),
-        "Z" => Some(GC_Z),
-        "Line_Separator" => Some(GC_ZL),
-        "Zl" => Some(GC_ZL),
-        "Paragraph_Separator" => Some(GC_ZP),
-        "Zp" => Some(GC_ZP),
-        "Space_Separator" => Some(GC_ZS),
-        "Zs" => Some(GC_ZS),
-        _ => None,
-    }
+    lookup_sorted(GC_BY_NAME, value)
 }
 
+static BINARY_BY_NAME: &[(&str, &[(u32, u32)])] = &[
+    ("AHex", BINARY_ASCII_HEX_DIGIT),
+    ("ASCII", BINARY_ASCII),
+    ("ASCII_Hex_Digit", BINARY_ASCII_HEX_DIGIT),
+    ("Alpha", BINARY_ALPHABETIC),
+    ("Alphabetic", BINARY_ALPHABETIC),
+    ("Any", BINARY_ANY),
+    ("Assigned", BINARY_ASSIGNED),
+    ("Bidi_C", BINARY_BIDI_CONTROL),
+    ("Bidi_Control", BINARY_BIDI_CONTROL),
+    ("CI", BINARY_CASE_IGNORABLE),
+    ("CWCF", BINARY_CHANGES_WHEN_CASEFOLDED),
+    ("CWCM", BINARY_CHANGES_WHEN_CASEMAPPED),
+    ("CWKCF", BINARY_CHANGES_WHEN_NFKC_CASEFOLDED),
+    ("CWL", BINARY_CHANGES_WHEN_LOWERCASED),
+    ("CWT", BINARY_CHANGES_WHEN_TITLECASED),
+    ("CWU", BINARY_CHANGES_WHEN_UPPERCASED),
+    ("Case_Ignorable", BINARY_CASE_IGNORABLE),
+    ("Cased", BINARY_CASED),
+    ("Changes_When_Casefolded", BINARY_CHANGES_WHEN_CASEFOLDED),
+    ("Changes_When_Casemapped", BINARY_CHANGES_WHEN_CASEMAPPED),
+    ("Changes_When_Lowercased", BINARY_CHANGES_WHEN_LOWERCASED),
+    (
+        "Changes_When_NFKC_Casefolded",
+        BINARY_CHANGES_WHEN_NFKC_CASEFOLDED,
+    ),
+    ("Changes_When_Titlecased", BINARY_CHANGES_WHEN_TITLECASED),
+    ("Changes_When_Uppercased", BINARY_CHANGES_WHEN_UPPERCASED),
+    ("DI", BINARY_DEFAULT_IGNORABLE_CODE_POINT),
+    ("Dash", BINARY_DASH),
+    (
+        "Default_Ignorable_Code_Point",
+        BINARY_DEFAULT_IGNORABLE_CODE_POINT,
+    ),
+    ("Dep", BINARY_DEPRECATED),
+    ("Deprecated", BINARY_DEPRECATED),
+    ("Dia", BINARY_DIACRITIC),
+    ("Diacritic", BINARY_DIACRITIC),
+    ("EBase", BINARY_EMOJI_MODIFIER_BASE),
+    ("EComp", BINARY_EMOJI_COMPONENT),
+    ("EMod", BINARY_EMOJI_MODIFIER),
+    ("EPres", BINARY_EMOJI_PRESENTATION),
+    ("Emoji", BINARY_EMOJI),
+    ("Emoji_Component", BINARY_EMOJI_COMPONENT),
+    ("Emoji_Modifier", BINARY_EMOJI_MODIFIER),
+    ("Emoji_Modifier_Base", BINARY_EMOJI_MODIFIER_BASE),
+    ("Emoji_Presentation", BINARY_EMOJI_PRESENTATION),
+    ("Expands_On_NFC", BINARY_EXPANDS_ON_NFC),
+    ("Expands_On_NFD", BINARY_EXPANDS_ON_NFD),
+    ("Expands_On_NFKC", BINARY_EXPANDS_ON_NFKC),
+    ("Expands_On_NFKD", BINARY_EXPANDS_ON_NFKD),
+    ("Ext", BINARY_EXTENDER),
+    ("ExtPict", BINARY_EXTENDED_PICTOGRAPHIC),
+    ("Extended_Pictographic", BINARY_EXTENDED_PICTOGRAPHIC),
+    ("Extender", BINARY_EXTENDER),
+    ("FC_NFKC", BINARY_FC_NFKC),
+    (
+        "Full_Composition_Exclusion",
+        BINARY_FULL_COMPOSITION_EXCLUSION,
+    ),
+    ("Gr_Base", BINARY_GRAPHEME_BASE),
+    ("Gr_Ext", BINARY_GRAPHEME_EXTEND),
+    ("Grapheme_Base", BINARY_GRAPHEME_BASE),
+    ("Grapheme_Extend", BINARY_GRAPHEME_EXTEND),
+    ("Grapheme_Link", BINARY_GRAPHEME_LINK),
+    ("Hex", BINARY_HEX_DIGIT),
+    ("Hex_Digit", BINARY_HEX_DIGIT),
+    ("Hyphen", BINARY_HYPHEN),
+    ("IDC", BINARY_ID_CONTINUE),
+    ("IDS", BINARY_ID_START),
+    ("IDSB", BINARY_IDS_BINARY_OPERATOR),
+    ("IDST", BINARY_IDS_TRINARY_OPERATOR),
+    ("IDSU", BINARY_IDS_UNARY_OPERATOR),
+    ("IDS_Binary_Operator", BINARY_IDS_BINARY_OPERATOR),
+    ("IDS_Trinary_Operator", BINARY_IDS_TRINARY_OPERATOR),
+    ("IDS_Unary_Operator", BINARY_IDS_UNARY_OPERATOR),
+    ("ID_Compat_Math_Continue", BINARY_ID_COMPAT_MATH_CONTINUE),
+    ("ID_Compat_Math_Start", BINARY_ID_COMPAT_MATH_START),
+    ("ID_Continue", BINARY_ID_CONTINUE),
+    ("ID_Start", BINARY_ID_START),
+    ("Ideo", BINARY_IDEOGRAPHIC),
+    ("Ideographic", BINARY_IDEOGRAPHIC),
+    ("InCB", BINARY_INCB),
+    ("Join_C", BINARY_JOIN_CONTROL),
+    ("Join_Control", BINARY_JOIN_CONTROL),
+    ("LOE", BINARY_LOGICAL_ORDER_EXCEPTION),
+    ("Logical_Order_Exception", BINARY_LOGICAL_ORDER_EXCEPTION),
+    ("Lower", BINARY_LOWERCASE),
+    ("Lowercase", BINARY_LOWERCASE),
+    ("Math", BINARY_MATH),
+    ("Modifier_Combining_Mark", BINARY_MODIFIER_COMBINING_MARK),
+    ("NChar", BINARY_NONCHARACTER_CODE_POINT),
+    ("NFC_QC", BINARY_NFC_QC),
+    ("NFD_QC", BINARY_NFD_QC),
+    ("NFKC_CF", BINARY_NFKC_CF),
+    ("NFKC_QC", BINARY_NFKC_QC),
+    ("NFKC_SCF", BINARY_NFKC_SCF),
+    ("NFKD_QC", BINARY_NFKD_QC),
+    ("Noncharacter_Code_Point", BINARY_NONCHARACTER_CODE_POINT),
+    ("Other_Alphabetic", BINARY_OTHER_ALPHABETIC),
+    (
+        "Other_Default_Ignorable_Code_Point",
+        BINARY_OTHER_DEFAULT_IGNORABLE_CODE_POINT,
+    ),
+    ("Other_Grapheme_Extend", BINARY_OTHER_GRAPHEME_EXTEND),
+    ("Other_ID_Continue", BINARY_OTHER_ID_CONTINUE),
+    ("Other_ID_Start", BINARY_OTHER_ID_START),
+    ("Other_Lowercase", BINARY_OTHER_LOWERCASE),
+    ("Other_Math", BINARY_OTHER_MATH),
+    ("Other_Uppercase", BINARY_OTHER_UPPERCASE),
+    ("Pat_Syn", BINARY_PATTERN_SYNTAX),
+    ("Pat_WS", BINARY_PATTERN_WHITE_SPACE),
+    ("Pattern_Syntax", BINARY_PATTERN_SYNTAX),
+    ("Pattern_White_Space", BINARY_PATTERN_WHITE_SPACE),
+    (
+        "Prepended_Concatenation_Mark",
+        BINARY_PREPENDED_CONCATENATION_MARK,
+    ),
+    ("QMark", BINARY_QUOTATION_MARK),
+    ("Quotation_Mark", BINARY_QUOTATION_MARK),
+    ("RI", BINARY_REGIONAL_INDICATOR),
+    ("Radical", BINARY_RADICAL),
+    ("Regional_Indicator", BINARY_REGIONAL_INDICATOR),
+    ("SD", BINARY_SOFT_DOTTED),
+    ("STerm", BINARY_SENTENCE_TERMINAL),
+    ("Sentence_Terminal", BINARY_SENTENCE_TERMINAL),
+    ("Soft_Dotted", BINARY_SOFT_DOTTED),
+    ("Term", BINARY_TERMINAL_PUNCTUATION),
+    ("Terminal_Punctuation", BINARY_TERMINAL_PUNCTUATION),
+    ("UIdeo", BINARY_UNIFIED_IDEOGRAPH),
+    ("Unified_Ideograph", BINARY_UNIFIED_IDEOGRAPH),
+    ("Upper", BINARY_UPPERCASE),
+    ("Uppercase", BINARY_UPPERCASE),
+    ("VS", BINARY_VARIATION_SELECTOR),
+    ("Variation_Selector", BINARY_VARIATION_SELECTOR),
+    ("WSpace", BINARY_WHITE_SPACE),
+    ("White_Space", BINARY_WHITE_SPACE),
+    ("XIDC", BINARY_XID_CONTINUE),
+    ("XIDS", BINARY_XID_START),
+    ("XID_Continue", BINARY_XID_CONTINUE),
+    ("XID_Start", BINARY_XID_START),
+    ("space", BINARY_WHITE_SPACE),
+];
+
 fn lookup_binary(name: &str) -> Option<&'static [(u32, u32)]> {
-    match name {
-        "ASCII" => Some(BINARY_ASCII),
-        "AHex" => Some(BINARY_ASCII_HEX_DIGIT),
-        "ASCII_Hex_Digit" => Some(BINARY_ASCII_HEX_DIGIT),
-        "Alpha" => Some(BINARY_ALPHABETIC),
-        "Alphabetic" => Some(BINARY_ALPHABETIC),
-        "Any" => Some(BINARY_ANY),
-        "Assigned" => Some(BINARY_ASSIGNED),
-        "Bidi_C" => Some(BINARY_BIDI_CONTROL),
-        "Bidi_Control" => Some(BINARY_BIDI_CONTROL),
-        "CI" => Some(BINARY_CASE_IGNORABLE),
-        "Case_Ignorable" => Some(BINARY_CASE_IGNORABLE),
-        "Cased" => Some(BINARY_CASED),
-        "CWCF" => Some(BINARY_CHANGES_WHEN_CASEFOLDED),
-        "Changes_When_Casefolded" => Some(BINARY_CHANGES_WHEN_CASEFOLDED),
-        "CWCM" => Some(BINARY_CHANGES_WHEN_CASEMAPPED),
-        "Changes_When_Casemapped" => Some(BINARY_CHANGES_WHEN_CASEMAPPED),
-        "CWL" => Some(BINARY_CHANGES_WHEN_LOWERCASED),
-        "Changes_When_Lowercased" => Some(BINARY_CHANGES_WHEN_LOWERCASED),
-        "CWKCF" => Some(BINARY_CHANGES_WHEN_NFKC_CASEFOLDED),
-        "Changes_When_NFKC_Casefolded" => Some(BINARY_CHANGES_WHEN_NFKC_CASEFOLDED),
-        "CWT" => Some(BINARY_CHANGES_WHEN_TITLECASED),
-        "Changes_When_Titlecased" => Some(BINARY_CHANGES_WHEN_TITLECASED),
-        "CWU" => Some(BINARY_CHANGES_WHEN_UPPERCASED),
-        "Changes_When_Uppercased" => Some(BINARY_CHANGES_WHEN_UPPERCASED),
-        "Dash" => Some(BINARY_DASH),
-        "DI" => Some(BINARY_DEFAULT_IGNORABLE_CODE_POINT),
-        "Default_Ignorable_Code_Point" => Some(BINARY_DEFAULT_IGNORABLE_CODE_POINT),
-        "Dep" => Some(BINARY_DEPRECATED),
-        "Deprecated" => Some(BINARY_DEPRECATED),
-        "Dia" => Some(BINARY_DIACRITIC),
-        "Diacritic" => Some(BINARY_DIACRITIC),
-        "Emoji" => Some(BINARY_EMOJI),
-        "EComp" => Some(BINARY_EMOJI_COMPONENT),
-        "Emoji_Component" => Some(BINARY_EMOJI_COMPONENT),
-        "EMod" => Some(BINARY_EMOJI_MODIFIER),
-        "Emoji_Modifier" => Some(BINARY_EMOJI_MODIFIER),
-        "EBase" => Some(BINARY_EMOJI_MODIFIER_BASE),
-        "Emoji_Modifier_Base" => Some(BINARY_EMOJI_MODIFIER_BASE),
-        "EPres" => Some(BINARY_EMOJI_PRESENTATION),
-        "Emoji_Presentation" => Some(BINARY_EMOJI_PRESENTATION),
-        "Expands_On_NFC" => Some(BINARY_EXPANDS_ON_NFC),
-        "Expands_On_NFD" => Some(BINARY_EXPANDS_ON_NFD),
-        "Expands_On_NFKC" => Some(BINARY_EXPANDS_ON_NFKC),
-        "Expands_On_NFKD" => Some(BINARY_EXPANDS_ON_NFKD),
-        "ExtPict" => Some(BINARY_EXTENDED_PICTOGRAPHIC),
-        "Extended_Pictographic" => Some(BINARY_EXTENDED_PICTOGRAPHIC),
-        "Ext" => Some(BINARY_EXTENDER),
-        "Extender" => Some(BINARY_EXTENDER),
-        "FC_NFKC" => Some(BINARY_FC_NFKC),
-        "Full_Composition_Exclusion" => Some(BINARY_FULL_COMPOSITION_EXCLUSION),
-        "Gr_Base" => Some(BINARY_GRAPHEME_BASE),
-        "Grapheme_Base" => Some(BINARY_GRAPHEME_BASE),
-        "Gr_Ext" => Some(BINARY_GRAPHEME_EXTEND),
-        "Grapheme_Extend" => Some(BINARY_GRAPHEME_EXTEND),
-        "Grapheme_Link" => Some(BINARY_GRAPHEME_LINK),
-        "Hex" => Some(BINARY_HEX_DIGIT),
-        "Hex_Digit" => Some(BINARY_HEX_DIGIT),
-        "Hyphen" => Some(BINARY_HYPHEN),
-        "IDSB" => Some(BINARY_IDS_BINARY_OPERATOR),
-        "IDS_Binary_Operator" => Some(BINARY_IDS_BINARY_OPERATOR),
-        "IDST" => Some(BINARY_IDS_TRINARY_OPERATOR),
-        "IDS_Trinary_Operator" => Some(BINARY_IDS_TRINARY_OPERATOR),
-        "IDSU" => Some(BINARY_IDS_UNARY_OPERATOR),
-        "IDS_Unary_Operator" => Some(BINARY_IDS_UNARY_OPERATOR),
-        "ID_Compat_Math_Continue" => Some(BINARY_ID_COMPAT_MATH_CONTINUE),
-        "ID_Compat_Math_Start" => Some(BINARY_ID_COMPAT_MATH_START),
-        "IDC" => Some(BINARY_ID_CONTINUE),
-        "ID_Continue" => Some(BINARY_ID_CONTINUE),
-        "IDS" => Some(BINARY_ID_START),
-        "ID_Start" => Some(BINARY_ID_START),
-        "Ideo" => Some(BINARY_IDEOGRAPHIC),
-        "Ideographic" => Some(BINARY_IDEOGRAPHIC),
-        "InCB" => Some(BINARY_INCB),
-        "Join_C" => Some(BINARY_JOIN_CONTROL),
-        "Join_Control" => Some(BINARY_JOIN_CONTROL),
-        "LOE" => Some(BINARY_LOGICAL_ORDER_EXCEPTION),
-        "Logical_Order_Exception" => Some(BINARY_LOGICAL_ORDER_EXCEPTION),
-        "Lower" => Some(BINARY_LOWERCASE),
-        "Lowercase" => Some(BINARY_LOWERCASE),
-        "Math" => Some(BINARY_MATH),
-        "Modifier_Combining_Mark" => Some(BINARY_MODIFIER_COMBINING_MARK),
-        "NFC_QC" => Some(BINARY_NFC_QC),
-        "NFD_QC" => Some(BINARY_NFD_QC),
-        "NFKC_CF" => Some(BINARY_NFKC_CF),
-        "NFKC_QC" => Some(BINARY_NFKC_QC),
-        "NFKC_SCF" => Some(BINARY_NFKC_SCF),
-        "NFKD_QC" => Some(BINARY_NFKD_QC),
-        "NChar" => Some(BINARY_NONCHARACTER_CODE_POINT),
-        "Noncharacter_Code_Point" => Some(BINARY_NONCHARACTER_CODE_POINT),
-        "Other_Alphabetic" => Some(BINARY_OTHER_ALPHABETIC),
-        "Other_Default_Ignorable_Code_Point" => Some(BINARY_OTHER_DEFAULT_IGNORABLE_CODE_POINT),
-        "Other_Grapheme_Extend" => Some(BINARY_OTHER_GRAPHEME_EXTEND),
-        "Other_ID_Continue" => Some(BINARY_OTHER_ID_CONTINUE),
-        "Other_ID_Start" => Some(BINARY_OTHER_ID_START),
-        "Other_Lowercase" => Some(BINARY_OTHER_LOWERCASE),
-        "Other_Math" => Some(BINARY_OTHER_MATH),
-        "Other_Uppercase" => Some(BINARY_OTHER_UPPERCASE),
-        "Pat_Syn" => Some(BINARY_PATTERN_SYNTAX),
-        "Pattern_Syntax" => Some(BINARY_PATTERN_SYNTAX),
-        "Pat_WS" => Some(BINARY_PATTERN_WHITE_SPACE),
-        "Pattern_White_Space" => Some(BINARY_PATTERN_WHITE_SPACE),
-        "Prepended_Concatenation_Mark" => Some(BINARY_PREPENDED_CONCATENATION_MARK),
-        "QMark" => Some(BINARY_QUOTATION_MARK),
-        "Quotation_Mark" => Some(BINARY_QUOTATION_MARK),
-        "Radical" => Some(BINARY_RADICAL),
-        "RI" => Some(BINARY_REGIONAL_INDICATOR),
-        "Regional_Indicator" => Some(BINARY_REGIONAL_INDICATOR),
-        "STerm" => Some(BINARY_SENTENCE_TERMINAL),
-        "Sentence_Terminal" => Some(BINARY_SENTENCE_TERMINAL),
-        "SD" => Some(BINARY_SOFT_DOTTED),
-        "Soft_Dotted" => Some(BINARY_SOFT_DOTTED),
-        "Term" => Some(BINARY_TERMINAL_PUNCTUATION),
-        "Terminal_Punctuation" => Some(BINARY_TERMINAL_PUNCTUATION),
-        "UIdeo" => Some(BINARY_UNIFIED_IDEOGRAPH),
-        "Unified_Ideograph" => Some(BINARY_UNIFIED_IDEOGRAPH),
-        "Upper" => Some(BINARY_UPPERCASE),
-        "Uppercase" => Some(BINARY_UPPERCASE),
-        "VS" => Some(BINARY_VARIATION_SELECTOR),
-        "Variation_Selector" => Some(BINARY_VARIATION_SELECTOR),
-        "WSpace" => Some(BINARY_WHITE_SPACE),
-        "White_Space" => Some(BINARY_WHITE_SPACE),
-        "space" => Some(BINARY_WHITE_SPACE),
-        "XIDC" => Some(BINARY_XID_CONTINUE),
-        "XID_Continue" => Some(BINARY_XID_CONTINUE),
-        "XIDS" => Some(BINARY_XID_START),
-        "XID_Start" => Some(BINARY_XID_START),
-        _ => None,
-    }
+    lookup_sorted(BINARY_BY_NAME, name)
 }
@@ -0,0 +1,41 @@
+use std::io::Write;
+use std::process::{Command, Output, Stdio};
+
+fn run_with_stdin(args: &[&str], source: &str) -> Output {
+    let mut child = Command::new(env!("CARGO_BIN_EXE_jsse"))
+        .args(args)
+        .stdin(Stdio::piped())
+        .stdout(Stdio::piped())
+        .stderr(Stdio::piped())
+        .spawn()
+        .expect("failed to run jsse");
+    child
+        .stdin
+        .take()
+        .expect("jsse stdin was not piped")
+        .write_all(source.as_bytes())
+        .expect("failed to write jsse stdin");
+    child.wait_with_output().expect("failed to wait for jsse")
+}
+
+#[test]
+fn stdin_source_runs_under_the_given_path() {
+    // The named file does not exist: with --stdin it is only used as a path.
+    let path = concat!(env!("CARGO_MANIFEST_DIR"), "/tests/does-not-exist.js");
+    let output = run_with_stdin(&["--stdin", path], "console.log(6 * 7);");
+
+    assert!(
+        output.status.success(),
+        "jsse failed: {}",
+        String::from_utf8_lossy(&output.stderr)
+    );
+    assert_eq!(String::from_utf8_lossy(&output.stdout), "42\n");
+}
+
+#[test]
+fn stdin_syntax_error_exits_with_code_2() {
+    let path = concat!(env!("CARGO_MANIFEST_DIR"), "/tests/does-not-exist.js");
+    let output = run_with_stdin(&["--stdin", path], "var = ;");
+
+    assert_eq!(output.status.code(), Some(2));
+}